@@ -1,8 +1,65 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 import os
+import re
+import json
+import shutil
 import subprocess
 import time
-from bs4 import BeautifulSoup
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from urllib.parse import quote, unquote
+
+# Files at least this large are fetched over several ranged connections at once
+PARALLEL_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024
+PARALLEL_DOWNLOAD_CONNECTIONS = 4
+
+# Waiting for the device to come back in recovery/sideload after "adb reboot recovery" (seconds)
+RECOVERY_WAIT_TIMEOUT = 60
+RECOVERY_POLL_INTERVAL = 1
+
+# Sibling build directories probed at once when neither user/ nor gms/ nor a zip is present
+DIR_SEARCH_WORKERS = 8
+
+# Read/write block size used when streaming response bodies to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Classifies an upper-cased zip name into its best priority bucket in a single match.
+# Alternatives are anchored lookaheads tried in priority order, so e.g. "OTA_FULL_UPDATE"
+# lands in 'full_update' even though "OTA" appears first in the name.
+BUILD_PRIORITY_RE = re.compile(
+    r'(?=.*FULL[_-]UPDATE)(?P<full_update>)'
+    r'|(?=.*FULL)(?P<full>)'
+    r'|(?=.*(?:UPDATE|PACKAGE|BUILD|RELEASE|OTA))(?P<keyword>)'
+)
+
+
+class RangeNotSupportedError(Exception):
+    """Raised when the server answers a ranged GET with the full body instead of 206"""
+
+
+class DownloadCancelled(Exception):
+    """Raised from inside a copy loop or directory walk when a stop event is set"""
+
+
+class _CountingWriter:
+    """File wrapper that counts bytes written and aborts the copy when any stop event is set"""
+
+    def __init__(self, f, stop_events=(), written=0):
+        self.f = f
+        self.stop_events = [e for e in stop_events if e is not None]
+        self.written = written
+
+    def write(self, data):
+        for event in self.stop_events:
+            if event.is_set():
+                raise DownloadCancelled()
+        self.f.write(data)
+        self.written += len(data)
+        return len(data)
+
 
 class ArtifactoryManager:
     def __init__(self, config, logger):
@@ -26,28 +83,165 @@ class ArtifactoryManager:
         else:
             self.logger.log("JFrog credentials not found in config.ini. Downloads will likely fail.", level='error')
 
-    def _find_build_file_in_directory(self, dir_url):
+        # Percentage lines in the log are opt-in; the progress bar is always updated
+        self.log_download_progress = self.config.getboolean('JFrog', 'log_download_progress', fallback=False)
+
+        # Persistent session so directory walks and downloads reuse keep-alive connections
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # One bounded pool shared by every directory search; nested walks run sequentially in it
+        self._dir_search_executor = ThreadPoolExecutor(max_workers=DIR_SEARCH_WORKERS,
+                                                       thread_name_prefix='dir-search')
+
+        # Log uploads go to a different host, so keep JFrog credentials off that session
+        self.upload_session = requests.Session()
+
+    def _select_build_zip(self, zip_files):
+        """Pick the best build package from a directory's zip files
+
+        Args:
+            zip_files (list): Zip file names found in one directory
+
+        Returns:
+            str: Selected file name, or None if the list is empty
+        """
+        # Sort zips into priority buckets with one regex match per file
+        buckets = {'full_update': [], 'full': [], 'keyword': []}
+        for zip_file in zip_files:
+            match = BUILD_PRIORITY_RE.match(zip_file.upper())
+            if match:
+                buckets[match.lastgroup].append(zip_file)
+
+        # Priority 1: Look for FULL_UPDATE packages (for sideload)
+        if buckets['full_update']:
+            zip_file = buckets['full_update'][0]
+            self.logger.log(f"Found FULL_UPDATE package: {zip_file}")
+            return zip_file
+
+        # Priority 2: Look for FULL packages
+        if buckets['full']:
+            zip_file = buckets['full'][0]
+            self.logger.log(f"Found FULL package: {zip_file}")
+            return zip_file
+
+        # Priority 3: Look for any .zip file with common update keywords
+        if buckets['keyword']:
+            zip_file = buckets['keyword'][0]
+            self.logger.log(f"Found update package: {zip_file}")
+            return zip_file
+
+        # Priority 4: Take any .zip file
+        if zip_files:
+            selected_zip = max(zip_files)
+            self.logger.log(f"Using zip file: {selected_zip}")
+            return selected_zip
+
+        return None
+
+    def _find_build_file_via_aql(self, dir_url):
+        """
+        Find the build file with a single Artifactory AQL query
+        Applies the same user/ -> gms/ -> package priority -> other subdirectories
+        order as the HTML walk, but over one JSON listing of every zip below dir_url
+
+        Args:
+            dir_url (str): Directory URL to search
+
+        Returns:
+            str: URL of the build file, or None if AQL is unavailable or found nothing
+        """
+        marker = '/artifactory/'
+        idx = dir_url.find(marker)
+        if idx == -1:
+            return None
+
+        base_url = dir_url[:idx + len(marker)]
+        # AQL matches on the stored (unescaped) names, so decode e.g. %20 from the link first
+        repo, _, path = unquote(dir_url[idx + len(marker):]).partition('/')
+        path = path.strip('/')
+
+        path_filter = ({"$or": [{"path": path}, {"path": {"$match": f"{path}/*"}}]}
+                       if path else {"path": {"$match": "*"}})
+        query = (f'items.find({json.dumps({"repo": repo, "name": {"$match": "*.zip"}, **path_filter})})'
+                 f'.include("repo", "path", "name")')
+
+        try:
+            response = self.session.post(base_url + 'api/search/aql', data=query,
+                                         headers={'Content-Type': 'text/plain'}, timeout=30)
+            response.raise_for_status()
+            results = response.json().get('results', [])
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self.logger.log(f"AQL search unavailable, falling back to directory listing: {e}")
+            return None
+
+        # Rebuild the directory tree below dir_url from the flat result list
+        files_by_dir = {}
+        for item in results:
+            item_path = '' if item.get('path') in (None, '.') else item['path']
+            rel_dir = item_path[len(path):].strip('/') if path else item_path
+            files_by_dir.setdefault(rel_dir, []).append(item['name'])
+
+        def child_dirs(rel_dir):
+            prefix = rel_dir + '/' if rel_dir else ''
+            return sorted({d[len(prefix):].split('/')[0] for d in files_by_dir
+                           if d.startswith(prefix) and d != rel_dir})
+
+        def pick(rel_dir):
+            children = child_dirs(rel_dir)
+            for preferred in ('user', 'gms'):
+                if preferred in children:
+                    return pick(f"{rel_dir}/{preferred}" if rel_dir else preferred)
+
+            selected_zip = self._select_build_zip(files_by_dir.get(rel_dir, []))
+            if selected_zip:
+                return f"{rel_dir}/{selected_zip}" if rel_dir else selected_zip
+
+            for child in children:
+                found = pick(f"{rel_dir}/{child}" if rel_dir else child)
+                if found:
+                    return found
+            return None
+
+        relative_file = pick('')
+        if not relative_file:
+            return None
+
+        full_path = f"{path}/{relative_file}" if path else relative_file
+        self.logger.log(f"AQL search found build file: {full_path}")
+        return f"{base_url}{quote(repo)}/{quote(full_path)}"
+
+    def _find_build_file_in_directory(self, dir_url, cancelled=None):
         """
         Recursively search for build file in directory
         Looks specifically in user/gms/ subdirectory structure
 
         Args:
             dir_url (str): Directory URL to search
+            cancelled (threading.Event): Set once the search is decided; only passed to
+                the sequential walks running in the search pool
 
         Returns:
             str: URL of the build file
         """
+        if cancelled is not None and cancelled.is_set():
+            raise DownloadCancelled()
         self.logger.log(f"Searching for build files in: {dir_url}")
 
-        response = requests.get(
-            dir_url,
-            auth=self.auth,
-            headers=self.headers,
-            timeout=30
-        )
+        response = self.session.get(dir_url, timeout=30)
         response.raise_for_status()
+        if cancelled is not None and cancelled.is_set():
+            raise DownloadCancelled()
+
+        # bs4 + lxml are only needed when a directory has to be browsed; import them on first use
+        from bs4 import BeautifulSoup, SoupStrainer
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Only <a> tags matter in an autoindex page, so skip building the rest of the DOM
+        soup = BeautifulSoup(response.text, 'lxml', parse_only=SoupStrainer('a'))
         links = soup.find_all('a')
 
         # Collect all files and directories
@@ -67,57 +261,188 @@ class ArtifactoryManager:
         # Priority: Look for user/ or gms/ directories first
         if 'user/' in subdirectories:
             self.logger.log("Found user/ directory, navigating into it...")
-            return self._find_build_file_in_directory(dir_url.rstrip('/') + '/user/')
+            return self._find_build_file_in_directory(dir_url.rstrip('/') + '/user/', cancelled)
 
         if 'gms/' in subdirectories:
             self.logger.log("Found gms/ directory, navigating into it...")
-            return self._find_build_file_in_directory(dir_url.rstrip('/') + '/gms/')
+            return self._find_build_file_in_directory(dir_url.rstrip('/') + '/gms/', cancelled)
 
-        # Priority 1: Look for FULL_UPDATE packages (for sideload)
-        for zip_file in zip_files:
-            if 'FULL_UPDATE' in zip_file.upper() or 'FULL-UPDATE' in zip_file.upper():
-                self.logger.log(f"Found FULL_UPDATE package: {zip_file}")
-                return dir_url.rstrip('/') + '/' + zip_file
-
-        # Priority 2: Look for FULL packages
-        for zip_file in zip_files:
-            if 'FULL' in zip_file.upper():
-                self.logger.log(f"Found FULL package: {zip_file}")
-                return dir_url.rstrip('/') + '/' + zip_file
-
-        # Priority 3: Look for any .zip file with common update keywords
-        update_keywords = ['UPDATE', 'PACKAGE', 'BUILD', 'RELEASE', 'OTA']
-        for zip_file in zip_files:
-            if any(keyword in zip_file.upper() for keyword in update_keywords):
-                self.logger.log(f"Found update package: {zip_file}")
-                return dir_url.rstrip('/') + '/' + zip_file
-
-        # Priority 4: Take any .zip file
-        if zip_files:
-            selected_zip = sorted(zip_files, reverse=True)[0]
-            self.logger.log(f"Using zip file: {selected_zip}")
+        selected_zip = self._select_build_zip(zip_files)
+        if selected_zip:
             return dir_url.rstrip('/') + '/' + selected_zip
 
         # Priority 5: Look in other subdirectories
         remaining_subdirs = [s for s in subdirectories if s not in ['user/', 'gms/']]
         if remaining_subdirs:
             self.logger.log(f"Searching {len(remaining_subdirs)} other subdirectories...")
-            for subdir in remaining_subdirs:
-                try:
-                    return self._find_build_file_in_directory(dir_url.rstrip('/') + '/' + subdir)
-                except Exception as e:
-                    self.logger.log(f"No build in {subdir}: {e}")
-                    continue
+            if cancelled is None:
+                found = self._search_subdirectories_in_parallel(dir_url, remaining_subdirs)
+                if found:
+                    return found
+            else:
+                # Already inside the search pool: walk the rest in listing order
+                for subdir in remaining_subdirs:
+                    try:
+                        return self._find_build_file_in_directory(dir_url.rstrip('/') + '/' + subdir, cancelled)
+                    except DownloadCancelled:
+                        raise
+                    except Exception as e:
+                        self.logger.log(f"No build in {subdir}: {e}")
 
         # Nothing found
         error_msg = f"No build file found in {dir_url}"
         raise Exception(error_msg)
 
-    def download_build(self, build_link, download_dir="builds", max_retries=3):
+    def _search_subdirectories_in_parallel(self, dir_url, subdirectories):
+        """Probe sibling directories concurrently, keeping the first hit in listing order
+
+        Returns:
+            str: URL of the build file, or None if no subdirectory has one
+        """
+        cancelled = threading.Event()
+        futures = [
+            (subdir, self._dir_search_executor.submit(self._find_build_file_in_directory,
+                                                      dir_url.rstrip('/') + '/' + subdir, cancelled))
+            for subdir in subdirectories
+        ]
+        try:
+            # Wait in submission order so the result matches a sequential walk
+            for subdir, future in futures:
+                try:
+                    return future.result()
+                except Exception as e:
+                    self.logger.log(f"No build in {subdir}: {e}")
+            return None
+        finally:
+            # Stop the probes that are still walking and drop the ones not started yet
+            cancelled.set()
+            for _, future in futures:
+                future.cancel()
+
+    def _probe_file(self, file_url):
+        """HEAD a file to learn its size, byte-range support and validator
+
+        Returns:
+            tuple: (total_size, accepts_ranges, validator) where validator is the
+            ETag or Last-Modified header, or None if the server sent neither
+        """
+        response = self.session.head(file_url, allow_redirects=True, timeout=30)
+        response.raise_for_status()
+        total_size = int(response.headers.get('content-length', 0))
+        accepts_ranges = response.headers.get('accept-ranges', '').lower() == 'bytes'
+        validator = response.headers.get('etag') or response.headers.get('last-modified')
+        return total_size, accepts_ranges, validator
+
+    def _read_validator(self, file_path):
+        """Read the validator stored next to a (partial) download, if any"""
+        try:
+            with open(file_path + '.etag', 'r') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _write_validator(self, file_path, validator):
+        """Store the remote validator next to the download so a later resume can be checked
+
+        Without a validator (HEAD failed or the server sent none) any existing sidecar is kept,
+        since it still describes the partial file on disk.
+        """
+        if validator:
+            with open(file_path + '.etag', 'w') as f:
+                f.write(validator)
+
+    def _download_parallel(self, file_url, file_path, total_size, stop_event=None, app=None,
+                           connections=PARALLEL_DOWNLOAD_CONNECTIONS):
+        """Download a file as several concurrent ranged GETs written in place
+
+        Data is written to a ``.part`` file that is renamed once every range is
+        complete, so an interrupted run never looks like a finished download.
+
+        Returns:
+            bool: True if the file was fully downloaded, False if cancelled
+
+        Raises:
+            RangeNotSupportedError: If the server ignores the Range header
+        """
+        part_path = file_path + '.part'
+        with open(part_path, 'wb') as f:
+            f.truncate(total_size)
+
+        span = -(-total_size // connections)  # ceiling division
+        ranges = [(start, min(start + span, total_size) - 1) for start in range(0, total_size, span)]
+
+        writers = []
+        cancelled = threading.Event()
+
+        def fetch_range(start, end):
+            response = self.session.get(file_url, headers={'Range': f'bytes={start}-{end}'},
+                                        stream=True, timeout=(30, 300))
+            response.raise_for_status()
+            if response.status_code != 206:
+                response.close()
+                raise RangeNotSupportedError(f"Server returned {response.status_code} for a ranged request")
+
+            with response, open(part_path, 'r+b') as f:
+                f.seek(start)
+                writer = _CountingWriter(f, (cancelled, stop_event))
+                writers.append(writer)
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, writer, DOWNLOAD_CHUNK_SIZE)
+
+        self.logger.log(f"Downloading in {len(ranges)} parallel ranges")
+
+        reporter_done = self._start_progress_reporter(writers, total_size, app)
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(fetch_range, start, end) for start, end in ranges]
+                try:
+                    done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+                    for future in done:
+                        future.result()
+                except DownloadCancelled:
+                    cancelled.set()
+                    return False
+                except Exception:
+                    cancelled.set()
+                    raise
+        finally:
+            reporter_done.set()
+
+        os.replace(part_path, file_path)
+        return True
+
+    def _start_progress_reporter(self, writers, total_size, app=None):
+        """Report download progress every 2 seconds from a side thread
+
+        Keeps the progress check out of the copy loop. ``writers`` may grow while
+        the reporter runs; their counts are summed on each tick. A log line is only
+        written when ``log_download_progress`` is enabled in the [JFrog] config.
+
+        Returns:
+            threading.Event: Set it to stop the reporter
+        """
+        done = threading.Event()
+
+        def report():
+            while not done.wait(2):
+                if total_size > 0:
+                    downloaded = sum(writer.written for writer in writers)
+                    if self.log_download_progress:
+                        percent = (downloaded / total_size) * 100
+                        self.logger.log(f"Download progress: {percent:.1f}%")
+                    if app:
+                        app.update_progress(downloaded, total_size, "Downloading")
+
+        threading.Thread(target=report, daemon=True).start()
+        return done
+
+    def download_build(self, build_link, stop_event=None, app=None, download_dir="builds", max_retries=3):
         """Download a build from JFrog Artifactory
 
         Args:
             build_link: URL to the build artifact or directory
+            stop_event: Threading event for cancellation
+            app: App instance for progress updates
             download_dir: Directory to save the downloaded file
             max_retries: Maximum retry attempts
 
@@ -146,7 +471,8 @@ class ArtifactoryManager:
                 self.logger.log("Detected directory URL, searching for build files...")
                 # Navigate directory structure to find actual build file
                 list_url = build_link if build_link.endswith('/') else build_link + '/'
-                actual_file_url = self._find_build_file_in_directory(list_url)
+                actual_file_url = (self._find_build_file_via_aql(list_url)
+                                   or self._find_build_file_in_directory(list_url))
                 file_name = os.path.basename(actual_file_url)
                 self.logger.log(f"Found build file: {file_name}")
             else:
@@ -157,30 +483,81 @@ class ArtifactoryManager:
 
             file_path = os.path.join(download_dir, file_name)
 
-            # Check if partial download exists
+            # HEAD first: size, range support and a validator to check any partial file against
+            try:
+                total_size, accepts_ranges, validator = self._probe_file(actual_file_url)
+            except requests.exceptions.RequestException as e:
+                if e.response is not None and e.response.status_code == 401:
+                    raise
+                self.logger.log(f"HEAD request failed, skipping resume validation: {e}", level='warning')
+                total_size, accepts_ranges, validator = 0, False, None
+
+            # Check if partial download exists and still belongs to the same remote file
             resume_byte_pos = 0
             if os.path.exists(file_path):
-                resume_byte_pos = os.path.getsize(file_path)
-                self.logger.log(f"Resuming download from byte position: {resume_byte_pos}")
+                local_size = os.path.getsize(file_path)
+                if validator is None:
+                    # Nothing to check the partial file against: plain Range resume as before
+                    resume_byte_pos = local_size
+                    if resume_byte_pos:
+                        self.logger.log(f"Resuming download from byte position: {resume_byte_pos}")
+                elif self._read_validator(file_path) == validator:
+                    if total_size and local_size == total_size:
+                        self.logger.log(f"Build already downloaded: {file_path}", level='success')
+                        return file_path
+                    if not total_size or local_size < total_size:
+                        resume_byte_pos = local_size
+                        self.logger.log(f"Resuming download from byte position: {resume_byte_pos}")
+
+                if resume_byte_pos == 0 and validator is not None:
+                    self.logger.log("Existing file does not match the remote build, restarting download", level='warning')
+                    os.remove(file_path)
+
+            self._write_validator(file_path, validator)
+
+            # Fresh download of a large file: try the multi-connection path first
+            if resume_byte_pos == 0 and accepts_ranges and total_size >= PARALLEL_DOWNLOAD_MIN_SIZE:
+                try:
+                    self.logger.log(f"File size: {total_size / (1024**2):.2f} MB")
+                    if self._download_parallel(actual_file_url, file_path, total_size, stop_event, app):
+                        if app:
+                            app.hide_progress()
+                        self.logger.log(f"Build downloaded successfully: {file_path}", level='success')
+                        return file_path
+                    self.logger.log("⚠️ Download cancelled by user", level='warning')
+                    if os.path.exists(file_path + '.part'):
+                        os.remove(file_path + '.part')
+                    return None
+                except (RangeNotSupportedError, requests.exceptions.RequestException,
+                        ProtocolError, ReadTimeoutError) as e:
+                    self.logger.log(f"Parallel download unavailable, using single stream: {e}", level='warning')
+                    if os.path.exists(file_path + '.part'):
+                        os.remove(file_path + '.part')
 
             # Download with retries
             for attempt in range(max_retries):
                 try:
-                    # Set up headers for resume if needed
-                    headers = dict(self.headers)  # Copy existing headers
+                    # Set up headers for resume if needed (auth headers come from the session)
+                    headers = {}
                     if resume_byte_pos > 0:
                         headers['Range'] = f'bytes={resume_byte_pos}-'
+                        # Server sends the whole file instead of a range if it changed meanwhile
+                        if validator:
+                            headers['If-Range'] = validator
 
                     self.logger.log(f"Downloading from: {actual_file_url}")
-                    response = requests.get(
+                    response = self.session.get(
                         actual_file_url,
-                        auth=self.auth,
                         headers=headers,
                         stream=True,
                         timeout=None  # No timeout for large files
                     )
                     response.raise_for_status()
 
+                    if resume_byte_pos > 0 and response.status_code == 200:
+                        self.logger.log("Server sent the full file instead of a range, restarting download", level='warning')
+                        resume_byte_pos = 0
+
                     # Get file size for progress tracking
                     if 'content-range' in response.headers:
                         # Resume case
@@ -190,36 +567,24 @@ class ArtifactoryManager:
                         # Fresh download
                         total_size = int(response.headers.get('content-length', 0))
 
-                    downloaded = resume_byte_pos
                     mode = 'ab' if resume_byte_pos > 0 else 'wb'
 
                     self.logger.log(f"File size: {total_size / (1024**2):.2f} MB")
                     if resume_byte_pos > 0:
                         self.logger.log(f"Already downloaded: {resume_byte_pos / (1024**2):.2f} MB")
 
-                    # Use larger chunk size for faster downloads
-                    chunk_size = 1024 * 1024  # 1 MB chunks
-
-                    with open(file_path, mode) as f:
-                        last_print_time = time.time()
-                        for chunk in response.iter_content(chunk_size=chunk_size):
-                            # Check for cancellation
-                            if stop_event and stop_event.is_set():
-                                self.logger.log("⚠️ Download cancelled by user", level='warning')
-                                return None
-
-                            if chunk:
-                                f.write(chunk)
-                                downloaded += len(chunk)
-
-                                # Update progress every 2 seconds
-                                current_time = time.time()
-                                if total_size > 0 and (current_time - last_print_time >= 2):
-                                    percent = (downloaded / total_size) * 100
-                                    self.logger.log(f"Download progress: {percent:.1f}%")
-                                    if app:
-                                        app.update_progress(downloaded, total_size, "Downloading")
-                                    last_print_time = current_time
+                    # Copy in C-level 1 MB blocks; progress is reported from a side thread
+                    with response, open(file_path, mode) as f:
+                        writer = _CountingWriter(f, (stop_event,), written=resume_byte_pos)
+                        reporter_done = self._start_progress_reporter([writer], total_size, app)
+                        try:
+                            response.raw.decode_content = True
+                            shutil.copyfileobj(response.raw, writer, DOWNLOAD_CHUNK_SIZE)
+                        except DownloadCancelled:
+                            self.logger.log("⚠️ Download cancelled by user", level='warning')
+                            return None
+                        finally:
+                            reporter_done.set()
 
                     if app:
                         app.hide_progress()
@@ -228,7 +593,8 @@ class ArtifactoryManager:
                     return file_path
 
                 except (requests.exceptions.ChunkedEncodingError,
-                        requests.exceptions.ConnectionError) as e:
+                        requests.exceptions.ConnectionError,
+                        ProtocolError, ReadTimeoutError) as e:
 
                     if attempt < max_retries - 1:
                         # Update resume position
@@ -268,6 +634,38 @@ class ArtifactoryManager:
         if file_path and not (stop_event and stop_event.is_set()):
             self.flash_build(file_path, device_serial, stop_event, app)
 
+    def _wait_for_recovery(self, device_serial=None, stop_event=None):
+        """Poll adb until the device reports recovery or sideload, the stop event is set or the wait times out
+
+        Returns:
+            bool: True once the device is in recovery/sideload, False on cancel or timeout
+        """
+        cmd = ["adb"]
+        if device_serial:
+            cmd.extend(["-s", device_serial])
+        cmd.append("get-state")
+
+        deadline = time.monotonic() + RECOVERY_WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            if stop_event and stop_event.is_set():
+                return False
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+                if result.stdout.strip() in ('recovery', 'sideload'):
+                    time.sleep(1)  # Brief settle time before sideload
+                    return True
+            except subprocess.TimeoutExpired:
+                pass  # adb server busy while the device reboots; try again
+            if stop_event:
+                stop_event.wait(RECOVERY_POLL_INTERVAL)
+            else:
+                time.sleep(RECOVERY_POLL_INTERVAL)
+
+        # Many user-build recoveries only show up over adb once sideload is started on the device
+        self.logger.log(f"Device not seen in recovery after {RECOVERY_WAIT_TIMEOUT}s, trying sideload anyway",
+                        level='warning')
+        return False
+
     def flash_build(self, file_path, device_serial=None, stop_event=None, app=None):
         """Flash a build file to connected device
 
@@ -299,9 +697,9 @@ class ArtifactoryManager:
 
             subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
 
-            # Wait for device to enter recovery
+            # Wait for device to enter recovery - polls until the recovery/sideload transport is up
             self.logger.log("Waiting for device to enter recovery mode...")
-            time.sleep(15)
+            self._wait_for_recovery(device_serial, stop_event)
 
             # Check for cancellation
             if stop_event and stop_event.is_set():
@@ -363,14 +761,34 @@ class ArtifactoryManager:
             if app:
                 app.hide_progress()
 
+    def _iter_multipart_file(self, field_name, file_path, boundary):
+        """Yield a single-file multipart/form-data body without reading the file into memory"""
+        file_name = os.path.basename(file_path)
+        yield (f'--{boundary}\r\n'
+               f'Content-Disposition: form-data; name="{field_name}"; filename="{file_name}"\r\n'
+               f'Content-Type: application/octet-stream\r\n\r\n').encode('utf-8')
+
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+        yield f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
     def upload_logs(self, log_file_path):
         self.logger.log(f"Uploading logs to webpage from {log_file_path}")
         webpage_url = self.config.get('Webpage', 'url')
         try:
-            with open(log_file_path, 'rb') as f:
-                files = {'file': (os.path.basename(log_file_path), f)}
-                response = requests.post(webpage_url, files=files)
-                response.raise_for_status()
+            # Same multipart 'file' field as before, but sent chunked straight from disk
+            boundary = uuid.uuid4().hex
+            response = self.upload_session.post(
+                webpage_url,
+                data=self._iter_multipart_file('file', log_file_path, boundary),
+                headers={'Content-Type': f'multipart/form-data; boundary={boundary}'}
+            )
+            response.raise_for_status()
             self.logger.log("Logs uploaded successfully.")
         except Exception as e:
             self.logger.log(f"Failed to upload logs: {e}", level='error')
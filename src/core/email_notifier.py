@@ -1,10 +1,49 @@
 import smtplib
+import threading
 from email.mime.text import MIMEText
 
+# Port on which the server speaks TLS from the first byte (no STARTTLS round-trip)
+SMTP_SSL_PORT = 465
+
 class EmailNotifier:
     def __init__(self, config, logger):
         self.config = config
         self.logger = logger
+        self._smtp = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Open, secure and authenticate a new SMTP connection"""
+        host = self.config.get('Email', 'smtp_server')
+        port = self.config.getint('Email', 'smtp_port')
+        if port == SMTP_SSL_PORT:
+            server = smtplib.SMTP_SSL(host, port)
+        else:
+            server = smtplib.SMTP(host, port)
+            server.starttls()
+        server.login(self.config.get('Email', 'sender_email'), self.config.get('Email', 'sender_password'))
+        return server
+
+    def _get_connection(self):
+        """Reuse the open connection if the server still answers, otherwise reconnect"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop_connection()
+        self._smtp = self._connect()
+        return self._smtp
+
+    def _drop_connection(self):
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._smtp = None
 
     def send_notification(self, subject, body):
         self.logger.log(f"Sending email notification: {subject}")
@@ -14,11 +53,20 @@ class EmailNotifier:
             msg['From'] = self.config.get('Email', 'sender_email')
             msg['To'] = self.config.get('Email', 'recipient_email')
 
-            with smtplib.SMTP(self.config.get('Email', 'smtp_server'), self.config.getint('Email', 'smtp_port')) as server:
-                server.starttls()
-                server.login(self.config.get('Email', 'sender_email'), self.config.get('Email', 'sender_password'))
-                server.send_message(msg)
+            with self._lock:
+                try:
+                    self._get_connection().send_message(msg)
+                except (smtplib.SMTPServerDisconnected, OSError):
+                    # The server hung up between the NOOP and the send; retry once on a fresh connection
+                    self._drop_connection()
+                    self._get_connection().send_message(msg)
             self.logger.log("Email sent successfully.")
         except Exception as e:
+            with self._lock:
+                self._drop_connection()
             self.logger.log(f"Failed to send email: {e}", level='error')
 
+    def close(self):
+        """Close the SMTP connection, if one is open"""
+        with self._lock:
+            self._drop_connection()
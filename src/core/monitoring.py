@@ -1,7 +1,17 @@
 import time
+import shutil
 import subprocess
 from threading import Thread
 import socket
+from tkinter import TclError
+
+# How often the PC IP address is re-resolved (seconds)
+IP_REFRESH_INTERVAL = 300
+# Upper bound for a single adb call, so a stuck adb server can't stall the Tk loop
+ADB_TIMEOUT = 3
+# Device poll interval (ms); while the device list stays the same it backs off to the max
+POLL_INTERVAL_MS = 5000
+MAX_POLL_INTERVAL_MS = 15000
 
 class MonitorDaemon:
     def __init__(self, app, web_server=None):
@@ -9,6 +19,15 @@ class MonitorDaemon:
         self.web_server = web_server
         self.running = False
         self.thread = None
+        self.adb_path = None
+        self.model_cache = {}  # serial -> model, filled the first time a device appears
+        self._cached_ip = None
+        self._ip_checked_at = 0
+        self._applied_options = {}  # widget path -> options last pushed to Tk
+        self._last_devices = None  # (serial, model) tuple last shown in the GUI
+        self._poll_interval = POLL_INTERVAL_MS
+        self._devices_changed = False  # set by _show_devices during a check
+        self._next_check = None  # after() id of the pending check
 
     def set_web_server(self, web_server):
         """Set the web server instance for pushing device updates"""
@@ -16,92 +35,157 @@ class MonitorDaemon:
 
     def start(self):
         self.running = True
+        self.adb_path = shutil.which("adb")
         # Use after() instead of thread to stay in main GUI thread
         self._schedule_check()
 
     def stop(self):
         self.running = False
+        if self._next_check is not None:
+            try:
+                self.app.after_cancel(self._next_check)
+            except TclError:
+                pass  # Window already destroyed
+            self._next_check = None
+
+    def notify(self):
+        """Ask for a device check right away, e.g. after a flash; safe to call from any thread"""
+        self.app.post_ui('monitor_check', self._check_now)
+
+    def _check_now(self):
+        if not self.running:
+            return
+        if self._next_check is not None:
+            self.app.after_cancel(self._next_check)
+        self._poll_interval = POLL_INTERVAL_MS
+        self._schedule_check()
+
+    def _config_if_changed(self, widget, **options):
+        """Configure a widget, skipping options whose value is already applied"""
+        applied = self._applied_options.setdefault(str(widget), {})
+        changed = {key: value for key, value in options.items() if applied.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            applied.update(changed)
+
+    def _show_devices(self, devices, devices_info):
+        """Push the device list to the dropdowns and device cards, only when it changed"""
+        device_key = tuple((d['serial'], d['model']) for d in devices_info)
+        if device_key == self._last_devices:
+            return
+        self._last_devices = device_key
+        self._devices_changed = True
+
+        self.app.update_device_dropdowns(devices)
+        self.app.update_device_list(devices_info)
+        self.app.update_flash_device_dropdown(devices_info)
 
     def _schedule_check(self):
         """Schedule the next check using tkinter's after() method"""
         if self.running:
+            self._devices_changed = False
             self.check_device_connectivity()
             self.check_pc_status()
-            # Schedule next check in 5 seconds
-            self.app.after(5000, self._schedule_check)
+
+            # Poll at the base rate after a change, backing off a step per quiet check
+            if self._devices_changed:
+                self._poll_interval = POLL_INTERVAL_MS
+            self._next_check = self.app.after(self._poll_interval, self._schedule_check)
+            if not self._devices_changed:
+                self._poll_interval = min(self._poll_interval + POLL_INTERVAL_MS, MAX_POLL_INTERVAL_MS)
 
     def check_device_connectivity(self):
+        if not self.adb_path:
+            self._show_adb_not_found()
+            return
+
         try:
             # Use adb to check for connected devices
-            result = subprocess.run(["adb", "devices", "-l"], capture_output=True, text=True, check=True)
+            result = subprocess.run([self.adb_path, "devices", "-l"], capture_output=True, text=True,
+                                    check=True, timeout=ADB_TIMEOUT)
             lines = result.stdout.strip().split('\n')[1:]
             devices = []
             devices_info = []
 
             for line in lines:
-                if "device" in line and "unauthorized" not in line:
-                    parts = line.split()
-                    serial = parts[0]
-
-                    # Extract model from the device line
-                    model_part = [p for p in parts if p.startswith('model:')]
-                    if model_part:
-                        model = model_part[0].split(':')[1]
-                    else:
-                        # Try to get model via getprop
-                        model = self.get_device_property(serial, "ro.product.model")
-
-                    devices.append(f"{model} ({serial})")
-                    devices_info.append({
-                        'serial': serial,
-                        'model': model,
-                        'display_name': f"{model} ({serial})"
-                    })
+                # Line format: "<serial> <state> usb:1-1 product:X model:Y device:Z transport_id:N"
+                parts = line.split()
+                if len(parts) < 2 or parts[1] != 'device':
+                    continue  # Skip blank, unauthorized, offline, etc.
+                serial = parts[0]
+
+                # Pick the model out of the key:value fields, falling back to the cache / getprop
+                props = dict(field.split(':', 1) for field in parts[2:] if ':' in field)
+                model = props.get('model') or self.model_cache.get(serial)
+                if not model:
+                    # Try to get model via getprop (once per newly seen serial)
+                    model = self.get_device_property(serial, "ro.product.model")
+                if model and model != "N/A":
+                    self.model_cache[serial] = model
+                else:
+                    model = "N/A"  # Not cached, so the next poll asks again
+
+                devices.append(f"{model} ({serial})")
+                devices_info.append({
+                    'serial': serial,
+                    'model': model,
+                    'display_name': f"{model} ({serial})"
+                })
+
+            # Forget devices that have been unplugged
+            connected = {d['serial'] for d in devices_info}
+            for serial in list(self.model_cache):
+                if serial not in connected:
+                    del self.model_cache[serial]
 
             if devices:
                 status_text = f"{len(devices)} Connected" if len(devices) > 1 else "1 Connected"
-                self.app.device_status_label.config(text=status_text)
-                self.app.device_status_indicator.config(fg=self.app.colors['status_connected'])
-                self.app.update_device_dropdowns(devices)
-                self.app.update_device_list(devices_info)
-                # Update flash device dropdown
-                self.app.flash_device_dropdown['values'] = devices
-                if len(devices) == 1:
-                    self.app.flash_device_dropdown.set(devices[0])
-
-                # Push to web server
-                if self.web_server:
-                    web_devices = [{'model': d['model'], 'serial': d['serial'], 'status': 'online'}
-                                  for d in devices_info]
-                    self.web_server.update_devices(web_devices)
-
+                self._config_if_changed(self.app.device_status_label, text=status_text)
+                self._config_if_changed(self.app.device_status_indicator, fg=self.app.colors['status_connected'])
             else:
-                self.app.device_status_label.config(text="No devices")
-                self.app.device_status_indicator.config(fg=self.app.colors['status_disconnected'])
-                self.app.update_device_dropdowns([])
-                self.app.update_device_list([])
-                # Clear flash device dropdown
-                self.app.flash_device_dropdown['values'] = []
-                self.app.flash_device_dropdown.set('')
-
-                # Push empty devices to web server
-                if self.web_server:
-                    self.web_server.update_devices([])
-
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            self.app.device_status_label.config(text="ADB Not Found")
-            self.app.device_status_indicator.config(fg=self.app.colors['warning'])
-            self.app.update_device_dropdowns([])
-            self.app.update_device_list([])
+                self._config_if_changed(self.app.device_status_label, text="No devices")
+                self._config_if_changed(self.app.device_status_indicator, fg=self.app.colors['status_disconnected'])
+            self._show_devices(devices, devices_info)
+
+            # Push to web server
+            if self.web_server:
+                web_devices = [{'model': d['model'], 'serial': d['serial'], 'status': 'online'}
+                              for d in devices_info]
+                self.web_server.update_devices(web_devices)
+
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            self._show_adb_not_found()
+
+    def _show_adb_not_found(self):
+        self._config_if_changed(self.app.device_status_label, text="ADB Not Found")
+        self._config_if_changed(self.app.device_status_indicator, fg=self.app.colors['warning'])
+        self._show_devices([], [])
 
     def get_device_property(self, serial, prop):
+        return self.get_device_properties(serial, [prop])[prop]
+
+    def get_device_properties(self, serial, props):
+        """Read several getprop values with a single adb shell round-trip"""
+        script = "; ".join(f"getprop {prop}" for prop in props)
         try:
-            result = subprocess.run(["adb", "-s", serial, "shell", "getprop", prop], capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return "N/A"
+            result = subprocess.run([self.adb_path or "adb", "-s", serial, "shell", script],
+                                    capture_output=True, text=True, check=True, timeout=ADB_TIMEOUT)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            return {prop: "N/A" for prop in props}
+
+        values = result.stdout.splitlines()
+        return {prop: values[i].strip() if i < len(values) else "N/A"
+                for i, prop in enumerate(props)}
 
     def get_pc_ip_address(self):
+        """Return the PC IP address, re-resolving it at most every IP_REFRESH_INTERVAL seconds"""
+        now = time.monotonic()
+        if self._cached_ip is None or now - self._ip_checked_at >= IP_REFRESH_INTERVAL:
+            self._cached_ip = self._lookup_pc_ip_address()
+            self._ip_checked_at = now
+        return self._cached_ip
+
+    def _lookup_pc_ip_address(self):
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
             # doesn't even have to be reachable
@@ -115,8 +199,6 @@ class MonitorDaemon:
 
     def check_pc_status(self):
         # For now, we'll just assume the PC is online if the app is running
-        self.app.pc_status_label.config(text="Online")
-        self.app.pc_status_indicator.config(fg=self.app.colors['status_online'])
-        pc_ip = self.get_pc_ip_address()
-        self.app.ip_label.config(text=pc_ip)
-
+        self._config_if_changed(self.app.pc_status_label, text="Online")
+        self._config_if_changed(self.app.pc_status_indicator, fg=self.app.colors['status_online'])
+        self._config_if_changed(self.app.ip_label, text=self.get_pc_ip_address())
@@ -1,10 +1,16 @@
 import requests
-from bs4 import BeautifulSoup
-
-import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import unquote
+
+from utils.fast_json import loads as json_loads
+
+# Matches test run links such as https://host/polarion/#/project/PID/testrun?id=RUN
+# (the project/id part may sit in the path or, with hash routing, in the fragment)
+POLARION_URL_RE = re.compile(
+    r'^(?P<base>https?://[^/?#]+)[^?]*?/project/(?P<project_id>[^/?#]+).*?[?&]id=(?P<test_run_id>[^&#]+)'
+)
 
 class PolarionManager:
     def __init__(self, config, logger):
@@ -21,33 +27,26 @@ class PolarionManager:
             # Fallback to basic auth if token is not present
             self.session.auth = (self.config.get('Polarion', 'user'), self.config.get('Polarion', 'password'))
 
+        # Pooled connections with backoff retries on transient gateway errors
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+                        allowed_methods=('GET', 'POST'))
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=16, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.verify = False
+
     def _get_api_url_from_web_url(self, web_url):
         """Converts a Polarion web URL for a test run into an API URL."""
-        try:
-            parsed_url = urlparse(web_url)
-            path_parts = parsed_url.path.split('/')
-            query_params = parse_qs(parsed_url.query)
-
-            project_id = None
-            if 'project' in path_parts:
-                project_id = path_parts[path_parts.index('project') + 1]
-
-            test_run_id = query_params.get('id', [None])[0]
-
-            if not project_id or not test_run_id:
-                self.logger.log("Could not parse project ID or test run ID from URL.", level='error')
-                return None
-
-            # Construct the API URL
-            # Assuming the base URL is the scheme + netloc from the original URL
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            api_url = f"{base_url}/polarion/rest/v1/projects/{project_id}/testruns/{test_run_id}/testrecords"
-            return api_url
-
-        except Exception as e:
-            self.logger.log(f"Error constructing API URL: {e}", level='error')
+        match = POLARION_URL_RE.search(web_url.strip())
+        if not match:
+            self.logger.log("Could not parse project ID or test run ID from URL.", level='error')
             return None
 
+        # Construct the API URL from the scheme + host of the original URL
+        project_id = match['project_id']
+        test_run_id = unquote(match['test_run_id'])
+        return f"{match['base']}/polarion/rest/v1/projects/{project_id}/testruns/{test_run_id}/testrecords"
+
     def download_sttls(self, test_run_url):
         self.logger.log(f"Attempting to download STTLs from web URL: {test_run_url}")
 
@@ -58,19 +57,20 @@ class PolarionManager:
         self.logger.log(f"Constructed API URL: {api_url}")
 
         try:
-            response = self.session.get(api_url, verify=False)
+            response = self.session.get(api_url)
             self.logger.log(f"API response status code: {response.status_code}")
             response.raise_for_status()
 
-            test_records_data = response.json()
+            test_records_data = json_loads(response.content)
 
-            sttls = []
-            if 'data' in test_records_data and isinstance(test_records_data['data'], list):
-                for record in test_records_data['data']:
-                    if record.get('type') == 'testrecord' and 'attributes' in record:
-                        test_case_id = record['attributes'].get('testCaseId')
-                        if test_case_id:
-                            sttls.append(test_case_id)
+            records = test_records_data.get('data') if isinstance(test_records_data, dict) else None
+            if not isinstance(records, list):
+                records = ()
+            sttls = [
+                test_case_id for record in records
+                if record.get('type') == 'testrecord'
+                and (test_case_id := (record.get('attributes') or {}).get('testCaseId'))
+            ]
 
             if sttls:
                 self.logger.log(f"Successfully found STTLs via API: {sttls}")
@@ -3,16 +3,33 @@ Scheduler module for recurring build flashing and testing tasks
 Handles task scheduling, execution, and persistence
 """
 import threading
+import heapq
 import time
-import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Callable, Optional
+from typing import List, Dict, Callable, Optional, Tuple
+
+from utils.fast_json import dumps as json_dumps, loads as json_loads
+
+# Longest the scheduler thread parks without re-checking tasks (seconds)
+MAX_IDLE_SECONDS = 3600
+# Day names accepted in weekly schedules, mapped to datetime.weekday() values
+_WEEKDAYS = {'Monday': 0, 'Tuesday': 1, 'Wednesday': 2, 'Thursday': 3,
+             'Friday': 4, 'Saturday': 5, 'Sunday': 6}
+# Units accepted in interval schedules such as "30m", "6h" or "2d"
+_INTERVAL_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days'}
+# Minimum gap between two writes of the task file while the scheduler runs (seconds)
+SAVE_DEBOUNCE_SECONDS = 2
 
 
 class ScheduledTask:
     """Represents a scheduled automation task"""
 
+    __slots__ = ('task_id', 'name', 'task_type', 'schedule_type', 'schedule_value',
+                 'config', 'enabled', 'last_run', 'next_run', 'run_count', 'last_status',
+                 '_parsed', '_parsed_for')
+
     def __init__(self, task_id: str, name: str, task_type: str,
                  schedule_type: str, schedule_value: str,
                  config: Dict, enabled: bool = True):
@@ -39,88 +56,90 @@ class ScheduledTask:
         self.next_run = None
         self.run_count = 0
         self.last_status = None
+        self._parsed = None  # schedule_value parsed for schedule_type, see _parse_schedule
+        self._parsed_for = None
 
         self._calculate_next_run()
 
-    def _calculate_next_run(self):
-        """Calculate the next run time based on schedule"""
-        now = datetime.now()
+    def _parse_schedule(self):
+        """Parse schedule_value once per (schedule_type, schedule_value) pair
 
-        if self.schedule_type == 'daily':
-            # schedule_value is time like "14:30"
-            try:
+        Leaves ``(hour, minute)`` for daily, ``(weekday, hour, minute)`` for weekly
+        and a timedelta for interval schedules in ``self._parsed``, or None if the
+        value is malformed.
+        """
+        self._parsed_for = (self.schedule_type, self.schedule_value)
+        self._parsed = None
+        try:
+            if self.schedule_type == 'daily':
+                # schedule_value is time like "14:30"
                 hour, minute = map(int, self.schedule_value.split(':'))
-                next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                if next_run <= now:
-                    next_run += timedelta(days=1)
-                self.next_run = next_run
-            except:
-                self.next_run = None
+                self._parsed = (hour, minute)
 
-        elif self.schedule_type == 'weekly':
-            # schedule_value is "Monday 14:30", "Tuesday 09:00", etc.
-            try:
+            elif self.schedule_type == 'weekly':
+                # schedule_value is "Monday 14:30", "Tuesday 09:00", etc.
                 parts = self.schedule_value.split()
-                day_name = parts[0]
                 time_str = parts[1] if len(parts) > 1 else "00:00"
                 hour, minute = map(int, time_str.split(':'))
+                self._parsed = (_WEEKDAYS[parts[0]], hour, minute)
+
+            elif self.schedule_type == 'interval':
+                # schedule_value is like "6h", "30m", "2d"
+                value = int(self.schedule_value[:-1])
+                unit = _INTERVAL_UNITS.get(self.schedule_value[-1])
+                self._parsed = timedelta(**{unit: value}) if unit else timedelta(hours=1)
+            if self.schedule_type in ('daily', 'weekly') and not (0 <= hour < 24 and 0 <= minute < 60):
+                raise ValueError(f"Invalid time of day: {self.schedule_value}")
+        except (ValueError, KeyError, IndexError, AttributeError):
+            self._parsed = None
+
+    def _calculate_next_run(self, now: Optional[datetime] = None):
+        """Calculate the next run time based on schedule, relative to ``now`` (default: current time)"""
+        if self._parsed_for != (self.schedule_type, self.schedule_value):
+            self._parse_schedule()
+        if self._parsed is None:
+            self.next_run = None
+            return
+
+        if now is None:
+            now = datetime.now()
 
-                days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                target_day = days.index(day_name)
-                current_day = now.weekday()
-
-                days_ahead = target_day - current_day
-                if days_ahead < 0:
-                    days_ahead += 7
-                elif days_ahead == 0:
-                    # Same day - check if time has passed
-                    target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    if target_time <= now:
-                        days_ahead = 7
-
-                next_run = now + timedelta(days=days_ahead)
-                next_run = next_run.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                self.next_run = next_run
-            except:
-                self.next_run = None
+        if self.schedule_type == 'daily':
+            hour, minute = self._parsed
+            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            self.next_run = next_run
+
+        elif self.schedule_type == 'weekly':
+            target_day, hour, minute = self._parsed
+            target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            days_ahead = (target_day - now.weekday()) % 7
+            if days_ahead == 0 and target_time <= now:
+                # Same day, but the time has passed
+                days_ahead = 7
+            self.next_run = target_time + timedelta(days=days_ahead)
 
         elif self.schedule_type == 'interval':
-            # schedule_value is like "6h", "30m", "2d"
-            try:
-                value = int(self.schedule_value[:-1])
-                unit = self.schedule_value[-1]
-
-                if unit == 'm':
-                    delta = timedelta(minutes=value)
-                elif unit == 'h':
-                    delta = timedelta(hours=value)
-                elif unit == 'd':
-                    delta = timedelta(days=value)
-                else:
-                    delta = timedelta(hours=1)
-
-                if self.last_run:
-                    self.next_run = self.last_run + delta
-                else:
-                    self.next_run = now + delta
-            except:
-                self.next_run = None
-
-    def should_run(self) -> bool:
-        """Check if task should run now"""
+            base = self.last_run or now
+            self.next_run = base + self._parsed
+
+    def should_run(self, now: Optional[datetime] = None) -> bool:
+        """Check if task should run now (callers checking many tasks can pass one shared ``now``)"""
         if not self.enabled or not self.next_run:
             return False
-        return datetime.now() >= self.next_run
+        return (now or datetime.now()) >= self.next_run
 
     def mark_executed(self, status: str):
         """Mark task as executed and calculate next run"""
-        self.last_run = datetime.now()
+        now = datetime.now()
+        self.last_run = now
         self.run_count += 1
         self.last_status = status
-        self._calculate_next_run()
+        self._calculate_next_run(now)
 
-    def to_dict(self) -> Dict:
-        """Convert task to dictionary for serialization"""
+    def _fields(self) -> Dict:
+        """Persisted fields, with datetimes left as datetime objects"""
         return {
             'task_id': self.task_id,
             'name': self.name,
@@ -129,12 +148,19 @@ class ScheduledTask:
             'schedule_value': self.schedule_value,
             'config': self.config,
             'enabled': self.enabled,
-            'last_run': self.last_run.isoformat() if self.last_run else None,
-            'next_run': self.next_run.isoformat() if self.next_run else None,
+            'last_run': self.last_run,
+            'next_run': self.next_run,
             'run_count': self.run_count,
             'last_status': self.last_status
         }
 
+    def to_dict(self) -> Dict:
+        """Convert task to dictionary for serialization"""
+        data = self._fields()
+        data['last_run'] = self.last_run.isoformat() if self.last_run else None
+        data['next_run'] = self.next_run.isoformat() if self.next_run else None
+        return data
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'ScheduledTask':
         """Create task from dictionary"""
@@ -158,22 +184,46 @@ class ScheduledTask:
         return task
 
 
+def _encode_task(o):
+    """fast_json default hook: serialize ScheduledTask fields directly, without a to_dict() pass"""
+    if isinstance(o, ScheduledTask):
+        return o._fields()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
 class TaskScheduler:
     """Manages and executes scheduled tasks"""
 
-    def __init__(self, persistence_file: str = 'scheduled_tasks.json'):
+    def __init__(self, persistence_file: str = 'scheduled_tasks.json', max_concurrent: int = 4):
         """
         Initialize the task scheduler
 
         Args:
             persistence_file: Path to JSON file for task persistence
+            max_concurrent: Maximum number of tasks executing at the same time
         """
-        self.tasks: List[ScheduledTask] = []
+        # Copy-on-write: mutations swap in a new tuple/dict under _tasks_lock, so readers can
+        # iterate whatever reference they grabbed without locking
+        self.tasks: Tuple[ScheduledTask, ...] = ()
+        self._by_id: Dict[str, ScheduledTask] = {}  # task_id -> task, kept in step with self.tasks
+        self._tasks_lock = threading.Lock()
         self.persistence_file = persistence_file
+        self.max_concurrent = max_concurrent
         self.running = False
         self.scheduler_thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}  # task_id -> execution queued or running on the pool
         self.task_executor: Optional[Callable] = None
         self.logger = None
+        self._wakeup = threading.Event()  # set whenever tasks change, to re-plan the next wake
+        self._running_tasks = set()  # IDs of tasks whose executor has not finished yet
+        # Min-heap of (next_run timestamp, task_id). Entries are never removed in place;
+        # ones that no longer match their task are dropped when popped.
+        self._heap: List[Tuple[float, str]] = []
+        self._heap_lock = threading.Lock()
+        self._save_lock = threading.Lock()  # save_tasks is called from GUI and worker threads
+        self._dirty = threading.Event()  # tasks changed since the last save
+        self._last_saved_at = 0.0
 
         # Load persisted tasks
         self.load_tasks()
@@ -201,11 +251,13 @@ class TaskScheduler:
         Returns:
             True if task was added, False if task_id already exists
         """
-        if any(t.task_id == task.task_id for t in self.tasks):
-            return False
-
-        self.tasks.append(task)
-        self.save_tasks()
+        with self._tasks_lock:
+            if task.task_id in self._by_id:
+                return False
+            self._by_id = {**self._by_id, task.task_id: task}
+            self.tasks = self.tasks + (task,)
+        self._mark_dirty()
+        self._push_task(task)
 
         if self.logger:
             self.logger.log(f"✅ Scheduled task added: {task.name}", level='success')
@@ -222,10 +274,14 @@ class TaskScheduler:
         Returns:
             True if task was removed, False if not found
         """
-        task = self.get_task(task_id)
+        with self._tasks_lock:
+            task = self._by_id.get(task_id)
+            if task:
+                self._by_id = {tid: t for tid, t in self._by_id.items() if tid != task_id}
+                self.tasks = tuple(t for t in self.tasks if t is not task)
         if task:
-            self.tasks.remove(task)
-            self.save_tasks()
+            self._mark_dirty()
+            self._wakeup.set()
 
             if self.logger:
                 self.logger.log(f"🗑️ Scheduled task removed: {task.name}", level='info')
@@ -243,27 +299,27 @@ class TaskScheduler:
         Returns:
             True if task was updated, False if not found
         """
-        for i, t in enumerate(self.tasks):
-            if t.task_id == task.task_id:
-                self.tasks[i] = task
-                self.save_tasks()
+        with self._tasks_lock:
+            existing = self._by_id.get(task.task_id)
+            if existing is None:
+                return False
+            self._by_id = {**self._by_id, task.task_id: task}
+            self.tasks = tuple(task if t is existing else t for t in self.tasks)
+        self._mark_dirty()
+        self._push_task(task)
 
-                if self.logger:
-                    self.logger.log(f"📝 Scheduled task updated: {task.name}", level='info')
+        if self.logger:
+            self.logger.log(f"📝 Scheduled task updated: {task.name}", level='info')
 
-                return True
-        return False
+        return True
 
     def get_task(self, task_id: str) -> Optional[ScheduledTask]:
         """Get task by ID"""
-        for task in self.tasks:
-            if task.task_id == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
 
-    def get_all_tasks(self) -> List[ScheduledTask]:
-        """Get all tasks"""
-        return self.tasks.copy()
+    def get_all_tasks(self) -> Tuple[ScheduledTask, ...]:
+        """Get all tasks (an immutable snapshot, safe to iterate from any thread)"""
+        return self.tasks
 
     def enable_task(self, task_id: str):
         """Enable a task"""
@@ -271,14 +327,16 @@ class TaskScheduler:
         if task:
             task.enabled = True
             task._calculate_next_run()
-            self.save_tasks()
+            self._mark_dirty()
+            self._push_task(task)
 
     def disable_task(self, task_id: str):
         """Disable a task"""
         task = self.get_task(task_id)
         if task:
             task.enabled = False
-            self.save_tasks()
+            self._mark_dirty()
+            self._wakeup.set()
 
     def start(self):
         """Start the scheduler background thread"""
@@ -286,6 +344,8 @@ class TaskScheduler:
             return
 
         self.running = True
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix='sched')
+        self._rebuild_heap()  # Re-queue anything dropped by a previous stop()
         self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.scheduler_thread.start()
 
@@ -295,28 +355,80 @@ class TaskScheduler:
     def stop(self):
         """Stop the scheduler"""
         self.running = False
+        self._wakeup.set()
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=2)
+        self._flush_pending_save(force=True)
+        if self._pool:
+            # Queued executions are dropped; ones already running finish in the background
+            # (cancelled by hand; shutdown(cancel_futures=True) needs Python 3.9)
+            for future in list(self._futures.values()):
+                future.cancel()
+            self._pool.shutdown(wait=False)
+            self._pool = None
 
         if self.logger:
             self.logger.log("⏸️ Task scheduler stopped", level='info')
 
+    def _push_task(self, task: ScheduledTask):
+        """Queue the task's next run on the heap and wake the scheduler to re-plan"""
+        if task.enabled and task.next_run:
+            with self._heap_lock:
+                heapq.heappush(self._heap, (task.next_run.timestamp(), task.task_id))
+        self._wakeup.set()
+
+    def _rebuild_heap(self):
+        """Rebuild the heap from scratch, e.g. after loading tasks from disk"""
+        with self._heap_lock:
+            self._heap = [(task.next_run.timestamp(), task.task_id)
+                          for task in self.tasks if task.enabled and task.next_run]
+            heapq.heapify(self._heap)
+
+    def _pop_due_tasks(self) -> List[ScheduledTask]:
+        """Pop every heap entry that is due, returning the tasks that still match it"""
+        now = time.time()
+        due = []
+        with self._heap_lock:
+            heap, heappop, by_id = self._heap, heapq.heappop, self._by_id
+            while heap and heap[0][0] <= now:
+                timestamp, task_id = heappop(heap)
+                task = by_id.get(task_id)
+                # Skip entries left behind by removed, disabled, rescheduled or running tasks
+                if (task is None or not task.enabled or not task.next_run
+                        or task.next_run.timestamp() != timestamp
+                        or task_id in self._running_tasks or task in due):
+                    continue
+                due.append(task)
+        return due
+
     def _scheduler_loop(self):
-        """Main scheduler loop running in background thread"""
+        """Main scheduler loop running in background thread
+
+        Sleeps until the earliest next_run (or until the task list changes)
+        instead of polling on a fixed interval.
+        """
         while self.running:
+            self._wakeup.clear()
             try:
-                # Check all tasks
-                for task in self.tasks:
-                    if task.should_run():
-                        self._execute_task(task)
+                for task in self._pop_due_tasks():
+                    self._execute_task(task)
 
-                # Sleep for 30 seconds between checks
-                time.sleep(30)
+                timeout = min(self._seconds_until_next_run(), self._flush_pending_save())
 
             except Exception as e:
                 if self.logger:
                     self.logger.log(f"Scheduler error: {e}", level='error')
-                time.sleep(60)  # Wait longer on error
+                timeout = 60  # Wait longer on error
+
+            self._wakeup.wait(timeout)
+
+    def _seconds_until_next_run(self) -> float:
+        """Seconds until the earliest heap entry is due, clamped to [0, MAX_IDLE_SECONDS]"""
+        with self._heap_lock:
+            if not self._heap:
+                return MAX_IDLE_SECONDS
+            next_timestamp = self._heap[0][0]
+        return min(max(0.0, next_timestamp - time.time()), MAX_IDLE_SECONDS)
 
     def _execute_task(self, task: ScheduledTask):
         """Execute a scheduled task"""
@@ -325,21 +437,29 @@ class TaskScheduler:
 
         try:
             if self.task_executor:
-                # Execute task in separate thread to not block scheduler
-                exec_thread = threading.Thread(
-                    target=self._run_task_executor,
-                    args=(task,),
-                    daemon=True
-                )
-                exec_thread.start()
+                # Execute task on the worker pool to not block scheduler
+                self._running_tasks.add(task.task_id)
+                future = self._pool.submit(self._run_task_executor, task)
+                self._futures[task.task_id] = future
+                future.add_done_callback(lambda f, task=task: self._on_executor_done(task, f))
             else:
                 if self.logger:
                     self.logger.log("⚠️ No task executor configured", level='warning')
                 task.mark_executed('error')
+                self._push_task(task)
         except Exception as e:
             if self.logger:
                 self.logger.log(f"Task execution error: {e}", level='error')
+            self._running_tasks.discard(task.task_id)
             task.mark_executed('error')
+            self._push_task(task)
+
+    def _on_executor_done(self, task: ScheduledTask, future):
+        """Forget a finished execution, releasing the task if it was cancelled before it started"""
+        if self._futures.get(task.task_id) is future:
+            del self._futures[task.task_id]
+        if future.cancelled():
+            self._running_tasks.discard(task.task_id)
 
     def _run_task_executor(self, task: ScheduledTask):
         """Run task executor and mark completion"""
@@ -352,18 +472,47 @@ class TaskScheduler:
             status = 'error'
 
         task.mark_executed(status)
+        self._mark_dirty()
+        self._running_tasks.discard(task.task_id)
+        self._push_task(task)
+
+    def _mark_dirty(self):
+        """Schedule a save; while the scheduler runs, bursts of changes share one write"""
+        if not self.running:
+            self.save_tasks()
+            return
+        self._dirty.set()
+        self._wakeup.set()
+
+    def _flush_pending_save(self, force: bool = False) -> float:
+        """Write pending changes if the debounce window has passed
+
+        Returns:
+            Seconds until a pending save is due, or MAX_IDLE_SECONDS if nothing is pending
+        """
+        if not self._dirty.is_set():
+            return MAX_IDLE_SECONDS
+        remaining = self._last_saved_at + SAVE_DEBOUNCE_SECONDS - time.monotonic()
+        if remaining > 0 and not force:
+            return remaining
+        self._dirty.clear()
         self.save_tasks()
+        return MAX_IDLE_SECONDS
 
     def save_tasks(self):
-        """Save tasks to JSON file"""
+        """Save tasks to JSON file (written to a temp file, then swapped in atomically)"""
+        tmp_file = self.persistence_file + '.tmp'
         try:
             data = {
-                'tasks': [task.to_dict() for task in self.tasks],
-                'last_saved': datetime.now().isoformat()
+                'tasks': self.get_all_tasks(),
+                'last_saved': datetime.now()
             }
 
-            with open(self.persistence_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._save_lock:
+                with open(tmp_file, 'wb') as f:
+                    f.write(json_dumps(data, default=_encode_task))
+                os.replace(tmp_file, self.persistence_file)
+            self._last_saved_at = time.monotonic()
         except Exception as e:
             if self.logger:
                 self.logger.log(f"Error saving tasks: {e}", level='error')
@@ -372,18 +521,24 @@ class TaskScheduler:
         """Load tasks from JSON file"""
         try:
             if os.path.exists(self.persistence_file):
-                with open(self.persistence_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.persistence_file, 'rb') as f:
+                    data = json_loads(f.read())
 
-                self.tasks = [
+                tasks = tuple(
                     ScheduledTask.from_dict(task_data)
                     for task_data in data.get('tasks', [])
-                ]
+                )
+                with self._tasks_lock:
+                    self.tasks = tasks
+                    self._by_id = {task.task_id: task for task in tasks}
+                self._rebuild_heap()
 
                 if self.logger:
                     self.logger.log(f"📂 Loaded {len(self.tasks)} scheduled tasks", level='info')
         except Exception as e:
             if self.logger:
                 self.logger.log(f"Error loading tasks: {e}", level='error')
-            self.tasks = []
+            with self._tasks_lock:
+                self.tasks = ()
+                self._by_id = {}
 
@@ -2,14 +2,47 @@
 ZAP Web Server - Test Bed Status Dashboard
 Displays real-time information about test beds, devices, test execution, and logs
 """
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, request
 from datetime import datetime
 import threading
+import time
 import os
 import json
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Optional
+import functools
 import socket
 
+from utils.fast_json import dumps as json_dumps
+
+try:
+    from waitress import serve
+except ImportError:  # Optional; fall back to Flask's built-in server
+    serve = None
+
+# Worker threads for waitress, so concurrent dashboard polls don't queue behind each other
+SERVER_THREADS = 8
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_local_ip() -> str:
+    """Get the local IP address of this machine (resolved once per process)"""
+    try:
+        # Connecting a UDP socket sends nothing; it just selects the outbound interface
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0.2)
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        pass
+    try:
+        # No route out (isolated testbed): fall back to the host's own addresses
+        addresses = socket.gethostbyname_ex(socket.gethostname())[2]
+        return next((ip for ip in addresses if not ip.startswith('127.')), addresses[0])
+    except (OSError, IndexError):
+        return "127.0.0.1"
+
 
 class ZAPWebServer:
     """Web server for displaying ZAP test bed status and information"""
@@ -31,7 +64,7 @@ class ZAPWebServer:
         # Data storage
         self.test_bed_status = {
             'online': True,
-            'ip_address': self._get_local_ip(),
+            'ip_address': _resolve_local_ip(),
             'hostname': socket.gethostname(),
             'last_updated': datetime.now().isoformat(),
             'zap_version': '2.0.0'
@@ -49,22 +82,52 @@ class ZAPWebServer:
             'failed': 0
         }
 
-        self.logs = []
         self.max_logs = 1000  # Keep last 1000 log entries
+        self.logs = deque(maxlen=self.max_logs)  # Oldest entries fall off automatically
+        # Same entries again, bucketed by level so filtered queries don't scan everything
+        self._logs_by_level = {level: deque(maxlen=self.max_logs)
+                               for level in ('info', 'success', 'warning', 'error')}
+
+        # Encoded JSON bodies of the status endpoints, dropped whenever the data changes
+        self._cached = {'testbed': None, 'devices': None, 'exec': None}
+        self._cache_lock = threading.Lock()
 
         self._setup_routes()
 
-    def _get_local_ip(self) -> str:
-        """Get the local IP address of this machine"""
-        try:
-            # Create a socket connection to determine local IP
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except Exception:
-            return "127.0.0.1"
+    @staticmethod
+    def _format_log(entry: tuple) -> Dict:
+        """Expand a stored log tuple into the dict served by the API"""
+        timestamp, level, message, source = entry
+        return {
+            'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+            'level': level,
+            'message': message,
+            'source': source
+        }
+
+    @staticmethod
+    def _tail(entries, limit: int) -> List[tuple]:
+        """Return the last ``limit`` entries of a deque in order, without copying the rest"""
+        if limit <= 0:
+            return list(entries)[-limit:]
+        tail = list(islice(reversed(entries), limit))
+        tail.reverse()
+        return tail
+
+    def _cached_response(self, key: str, build) -> Response:
+        """Return the cached JSON body for ``key``, encoding ``build()`` on a miss"""
+        with self._cache_lock:
+            body = self._cached[key]
+            if body is None:
+                body = json_dumps(build())
+                self._cached[key] = body
+        return Response(body, mimetype='application/json')
+
+    def _invalidate(self, *keys: str):
+        """Drop cached bodies; call after the underlying data has been changed"""
+        with self._cache_lock:
+            for key in keys:
+                self._cached[key] = None
 
     def _setup_routes(self):
         """Setup Flask routes"""
@@ -77,12 +140,12 @@ class ZAPWebServer:
         @self.app.route('/api/testbed')
         def get_testbed_status():
             """API endpoint for test bed status"""
-            return jsonify(self.test_bed_status)
+            return self._cached_response('testbed', lambda: self.test_bed_status)
 
         @self.app.route('/api/devices')
         def get_devices():
             """API endpoint for device status"""
-            return jsonify({
+            return self._cached_response('devices', lambda: {
                 'devices': self.devices_status,
                 'count': len(self.devices_status)
             })
@@ -90,7 +153,7 @@ class ZAPWebServer:
         @self.app.route('/api/test-execution')
         def get_test_execution():
             """API endpoint for test execution status"""
-            return jsonify(self.test_execution_status)
+            return self._cached_response('exec', lambda: self.test_execution_status)
 
         @self.app.route('/api/logs')
         def get_logs():
@@ -98,23 +161,33 @@ class ZAPWebServer:
             limit = request.args.get('limit', 100, type=int)
             level = request.args.get('level', 'all')
 
-            filtered_logs = self.logs
-            if level != 'all':
-                filtered_logs = [log for log in self.logs if log.get('level') == level]
+            if level == 'all':
+                logs = self.logs
+            else:
+                logs = self._logs_by_level.get(level, ())
 
-            return jsonify({
-                'logs': filtered_logs[-limit:],
-                'total': len(filtered_logs)
+            body = json_dumps({
+                'logs': [self._format_log(entry) for entry in self._tail(logs, limit)],
+                'total': len(logs)
             })
+            return Response(body, mimetype='application/json')
 
         @self.app.route('/api/logs/download')
         def download_logs():
-            """API endpoint to download logs as JSON"""
-            return jsonify({
-                'logs': self.logs,
+            """API endpoint to download logs as NDJSON (a header line, then one line per log)"""
+            logs = list(self.logs)
+            header = {
                 'exported_at': datetime.now().isoformat(),
-                'test_bed': self.test_bed_status
-            })
+                'test_bed': self.test_bed_status,
+                'count': len(logs)
+            }
+
+            def generate():
+                yield json_dumps(header) + b'\n'
+                for entry in logs:
+                    yield json_dumps(self._format_log(entry)) + b'\n'
+
+            return Response(generate(), mimetype='application/x-ndjson')
 
     def update_testbed_status(self, online: bool = True, **kwargs):
         """
@@ -129,6 +202,7 @@ class ZAPWebServer:
 
         for key, value in kwargs.items():
             self.test_bed_status[key] = value
+        self._invalidate('testbed')
 
     def update_devices(self, devices: List[Dict]):
         """
@@ -139,6 +213,7 @@ class ZAPWebServer:
         """
         self.devices_status = devices
         self.test_bed_status['last_updated'] = datetime.now().isoformat()
+        self._invalidate('devices', 'testbed')
 
     def start_test_execution(self, test_name: str, devices: List[str], total_tests: int = 0):
         """
@@ -159,6 +234,7 @@ class ZAPWebServer:
             'passed': 0,
             'failed': 0
         }
+        self._invalidate('exec')
 
     def update_test_progress(self, current_test: str = None, passed: int = None, failed: int = None):
         """
@@ -175,11 +251,13 @@ class ZAPWebServer:
             self.test_execution_status['passed'] = passed
         if failed is not None:
             self.test_execution_status['failed'] = failed
+        self._invalidate('exec')
 
     def end_test_execution(self):
         """Mark test execution as complete"""
         self.test_execution_status['in_progress'] = False
         self.test_execution_status['end_time'] = datetime.now().isoformat()
+        self._invalidate('exec')
 
     def add_log(self, message: str, level: str = 'info', source: str = 'ZAP'):
         """
@@ -190,22 +268,38 @@ class ZAPWebServer:
             level: Log level (info, success, warning, error)
             source: Source of the log (ZAP, Zybot, Polarion, etc.)
         """
-        log_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'level': level,
-            'message': message,
-            'source': source
-        }
+        # Stored compactly as (epoch seconds, level, message, source); see _format_log
+        log_entry = (time.time(), level, message, source)
 
         self.logs.append(log_entry)
+        level_logs = self._logs_by_level.get(level)
+        if level_logs is None:
+            level_logs = self._logs_by_level.setdefault(level, deque(maxlen=self.max_logs))
+        level_logs.append(log_entry)
+
+    def add_logs(self, messages, level: str = 'info', source: str = 'ZAP'):
+        """
+        Add several log entries of the same level in one call
+
+        Args:
+            messages: Log messages, oldest first
+            level: Log level (info, success, warning, error)
+            source: Source of the logs (ZAP, Zybot, Polarion, etc.)
+        """
+        now = time.time()
+        log_entries = [(now, level, message, source) for message in messages]
 
-        # Trim logs if exceeding max
-        if len(self.logs) > self.max_logs:
-            self.logs = self.logs[-self.max_logs:]
+        self.logs.extend(log_entries)
+        level_logs = self._logs_by_level.get(level)
+        if level_logs is None:
+            level_logs = self._logs_by_level.setdefault(level, deque(maxlen=self.max_logs))
+        level_logs.extend(log_entries)
 
     def clear_logs(self):
         """Clear all stored logs"""
-        self.logs = []
+        self.logs.clear()
+        for level_logs in list(self._logs_by_level.values()):
+            level_logs.clear()
 
     def start(self):
         """Start the web server in a background thread"""
@@ -220,8 +314,11 @@ class ZAPWebServer:
         print(f"   Also accessible at http://localhost:{self.port}")
 
     def _run_server(self):
-        """Run the Flask server"""
-        self.app.run(host='0.0.0.0', port=self.port, debug=False, use_reloader=False)
+        """Run the Flask app under waitress, or the Flask development server if unavailable"""
+        if serve is not None:
+            serve(self.app, host='0.0.0.0', port=self.port, threads=SERVER_THREADS, _quiet=True)
+        else:
+            self.app.run(host='0.0.0.0', port=self.port, debug=False, use_reloader=False)
 
     def stop(self):
         """Stop the web server"""
@@ -1,5 +1,27 @@
 import subprocess
+import codecs
+import functools
 import os
+import shlex
+
+# Bytes read from the Zybot output pipe per os.read() call
+OUTPUT_CHUNK_SIZE = 64 * 1024
+
+
+def _build_args(zybot_path, polarion_run_name, devices, sttls):
+    args = [zybot_path, '-d', polarion_run_name]
+    for dut, device_id in devices:
+        args += ['-v', f'{dut}:{device_id}']
+    for sttl in sttls:
+        args += ['-t', sttl]
+    args.append("/TS/")  # Placeholder for the test suite path
+    return args
+
+
+@functools.lru_cache(maxsize=64)
+def _command_line(zybot_path, polarion_run_name, devices, sttls):
+    """Command line for hashable (tuple) inputs; the GUI preview asks for the same one on most keystrokes"""
+    return subprocess.list2cmdline(_build_args(zybot_path, polarion_run_name, devices, sttls))
 
 class ZybotExecutor:
     def __init__(self, config, logger):
@@ -19,15 +41,14 @@ class ZybotExecutor:
         self.logger.log(f"Executing custom Zybot command: {command}")
 
         try:
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True, text=True)
-
-            for line in iter(process.stdout.readline, ''):
-                if stop_event and stop_event.is_set():
-                    process.terminate()
-                    self.logger.log("⚠️ Zybot execution cancelled by user", level='warning')
-                    return "Cancelled"
+            # Windows hands the command line straight to CreateProcess; elsewhere split it like a shell would
+            args = command if os.name == 'nt' else shlex.split(command)
+            process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
 
-                self.logger.log(line.strip())
+            if not self._stream_output(process, stop_event):
+                process.terminate()
+                self.logger.log("⚠️ Zybot execution cancelled by user", level='warning')
+                return "Cancelled"
 
             process.stdout.close()
             return_code = process.wait()
@@ -43,20 +64,17 @@ class ZybotExecutor:
             return "Fail"
 
     def run_tests(self, polarion_run_name, devices, sttls, stop_event=None):
-        command = self.get_command_string(polarion_run_name, devices, sttls)
+        args = self.get_command_args(polarion_run_name, devices, sttls)
 
-        self.logger.log(f"Executing Zybot command: {command}")
+        self.logger.log(f"Executing Zybot command: {subprocess.list2cmdline(args)}")
 
         try:
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True, text=True)
+            process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
 
-            for line in iter(process.stdout.readline, ''):
-                if stop_event and stop_event.is_set():
-                    process.terminate()
-                    self.logger.log("⚠️ Zybot execution cancelled by user", level='warning')
-                    return "Cancelled"
-
-                self.logger.log(line.strip())
+            if not self._stream_output(process, stop_event):
+                process.terminate()
+                self.logger.log("⚠️ Zybot execution cancelled by user", level='warning')
+                return "Cancelled"
 
             process.stdout.close()
             return_code = process.wait()
@@ -71,12 +89,36 @@ class ZybotExecutor:
             self.logger.log(f"An error occurred during Zybot execution: {e}", level='error')
             return "Fail"
 
+    def _stream_output(self, process, stop_event=None):
+        """Forward the process output to the logger, one batch of lines per pipe read
+
+        Returns:
+            bool: False if stop_event was set before the output ended
+        """
+        fd = process.stdout.fileno()
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending = ''
+        while True:
+            data = os.read(fd, OUTPUT_CHUNK_SIZE)
+            if stop_event and stop_event.is_set():
+                return False
+            if not data:
+                break
+
+            lines = (pending + decoder.decode(data)).split('\n')
+            pending = lines.pop()  # Partial last line, completed by the next read
+            self.logger.log_many([line.strip() for line in lines])
+
+        pending += decoder.decode(b'', final=True)
+        if pending:
+            self.logger.log(pending.strip())
+        return True
+
+    def get_command_args(self, polarion_run_name, devices, sttls):
+        """Build the Zybot argv list (run without a shell)"""
+        return _build_args(self.config.get('Zybot', 'path'), polarion_run_name, devices.items(), sttls)
+
     def get_command_string(self, polarion_run_name, devices, sttls):
-        zybot_path = self.config.get('Zybot', 'path')
-        command = f'"{zybot_path}" -d "{polarion_run_name}"'
-        for dut, device_id in devices.items():
-            command += f' -v {dut}:{device_id}'
-        for sttl in sttls:
-            command += f' -t "{sttl}"'
-        command += " /TS/" # Placeholder for the test suite path
-        return command
+        """Build the Zybot command line shown in (and editable from) the GUI"""
+        return _command_line(self.config.get('Zybot', 'path'), polarion_run_name,
+                             tuple(devices.items()), tuple(sttls))
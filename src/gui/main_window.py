@@ -1,5 +1,6 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk, font, scrolledtext
+import queue
 import sys
 import os
 
@@ -8,6 +9,14 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.tooltip import add_tooltip
 
+# Shared (integer) paddings, reused so pack() gets the same objects each time
+PAD_CARD = (0, 15)   # below each section card
+PAD_GROUP = (5, 10)  # around a group of controls inside a card
+PAD_ROW = (4, 0)     # above an indicator/status row
+
+# How often updates posted from worker threads are applied to the widgets (ms)
+UI_DRAIN_INTERVAL = 100
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -33,9 +42,33 @@ class App(tk.Tk):
         }
 
         self.configure(bg=self.colors['bg'])
+        self._create_fonts()
         self._setup_styles()
         self.create_widgets()
 
+        self._ui_queue = queue.Queue()  # (key, callback, args) posted via post_ui
+        self.after(UI_DRAIN_INTERVAL, self._drain_ui_queue)
+
+    def _create_fonts(self):
+        """Create the named fonts shared by all widgets, so Tk resolves each one only once"""
+        def ui(size, weight='normal'):
+            return font.Font(self, family='Segoe UI', size=size, weight=weight)
+
+        self.F_TINY = ui(7)
+        self.F_TINY_BOLD = ui(7, 'bold')
+        self.F_SMALL = ui(8)
+        self.F_SMALL_BOLD = ui(8, 'bold')
+        self.F_BODY = ui(9)
+        self.F_BOLD = ui(9, 'bold')
+        self.F_LARGE = ui(10)
+        self.F_SECTION = ui(10, 'bold')
+        self.F_HEADER = ui(11, 'bold')
+        self.F_INDICATOR_SMALL = ui(12)
+        self.F_INDICATOR = ui(14)
+        self.F_TITLE = ui(16, 'bold')
+        self.F_MONO_SMALL = font.Font(self, family='Consolas', size=8)
+        self.F_MONO = font.Font(self, family='Consolas', size=9)
+
     def _setup_styles(self):
         """Configure modern ttk styles"""
         style = ttk.Style()
@@ -46,37 +79,42 @@ class App(tk.Tk):
         except:
             pass
 
-        # Configure frame styles
-        style.configure('Card.TFrame', background=self.colors['card_bg'], relief='flat', borderwidth=1)
-        style.configure('Main.TFrame', background=self.colors['bg'])
-
-        # Configure label frame styles
-        style.configure('Card.TLabelframe', background=self.colors['card_bg'], relief='solid', borderwidth=1, bordercolor=self.colors['border'])
-        style.configure('Card.TLabelframe.Label', background=self.colors['card_bg'], foreground=self.colors['text'], font=('Segoe UI', 10, 'bold'))
-
-        # Configure label styles
-        style.configure('TLabel', background=self.colors['card_bg'], foreground=self.colors['text'], font=('Segoe UI', 9))
-        style.configure('Header.TLabel', font=('Segoe UI', 11, 'bold'), foreground=self.colors['text'])
-        style.configure('Status.TLabel', font=('Segoe UI', 9, 'bold'))
-
-        # Configure button styles
-        style.configure('Primary.TButton', font=('Segoe UI', 9, 'bold'), padding=8)
-        style.map('Primary.TButton',
-                  foreground=[('active', 'white'), ('!active', 'white')],
-                  background=[('active', self.colors['primary_hover']), ('!active', self.colors['primary'])])
-
-        style.configure('Danger.TButton', font=('Segoe UI', 9, 'bold'), padding=8)
-        style.map('Danger.TButton',
-                  foreground=[('active', 'white')],
-                  background=[('active', '#c82333'), ('!active', self.colors['danger'])])
-
-        style.configure('Success.TButton', font=('Segoe UI', 9, 'bold'), padding=8)
-
-        # Configure entry styles
-        style.configure('TEntry', fieldbackground='white', padding=6)
+        colors = self.colors
+        styles = {
+            # Frame styles
+            'Card.TFrame': dict(background=colors['card_bg'], relief='flat', borderwidth=1),
+            'Main.TFrame': dict(background=colors['bg']),
+            # Label frame styles
+            'Card.TLabelframe': dict(background=colors['card_bg'], relief='solid', borderwidth=1, bordercolor=colors['border']),
+            'Card.TLabelframe.Label': dict(background=colors['card_bg'], foreground=colors['text'], font=self.F_SECTION),
+            # Label styles
+            'TLabel': dict(background=colors['card_bg'], foreground=colors['text'], font=self.F_BODY),
+            'Header.TLabel': dict(font=self.F_HEADER, foreground=colors['text']),
+            'Status.TLabel': dict(font=self.F_BOLD),
+            # Button styles
+            'Primary.TButton': dict(font=self.F_BOLD, padding=8),
+            'Danger.TButton': dict(font=self.F_BOLD, padding=8),
+            'Success.TButton': dict(font=self.F_BOLD, padding=8),
+            # Entry and combobox styles
+            'TEntry': dict(fieldbackground='white', padding=6),
+            'TCombobox': dict(padding=6),
+            # Device list
+            'Devices.Treeview': dict(background='white', fieldbackground='#f8f9fa', foreground=colors['text'],
+                                     font=self.F_SMALL, rowheight=24),
+            'Devices.Treeview.Heading': dict(font=self.F_SMALL_BOLD, foreground=colors['text_light']),
+        }
+        style_maps = {
+            'Primary.TButton': dict(foreground=[('active', 'white'), ('!active', 'white')],
+                                    background=[('active', colors['primary_hover']), ('!active', colors['primary'])]),
+            'Danger.TButton': dict(foreground=[('active', 'white')],
+                                   background=[('active', '#c82333'), ('!active', colors['danger'])]),
+        }
 
-        # Configure combobox styles
-        style.configure('TCombobox', padding=6)
+        configure, map_style = style.configure, style.map
+        for name, options in styles.items():
+            configure(name, **options)
+        for name, options in style_maps.items():
+            map_style(name, **options)
 
     def create_widgets(self):
         # Main container
@@ -86,10 +124,10 @@ class App(tk.Tk):
         # Header Section
         header_frame = tk.Frame(main_container, bg=self.colors['card_bg'], relief='flat', bd=1,
                                highlightbackground=self.colors['border'], highlightthickness=1)
-        header_frame.pack(fill=tk.X, pady=(0, 15))
+        header_frame.pack(fill=tk.X, pady=PAD_CARD)
 
         title_label = tk.Label(header_frame, text="🦓 ZAP - Zebra Automation Platform",
-                               font=('Segoe UI', 16, 'bold'), bg=self.colors['card_bg'],
+                               font=self.F_TITLE, bg=self.colors['card_bg'],
                                fg=self.colors['primary'], pady=15, padx=20)
         title_label.pack(side=tk.LEFT)
 
@@ -111,37 +149,74 @@ class App(tk.Tk):
 
         # Create canvas and scrollbar for left column
         left_canvas = tk.Canvas(left_column_container, bg=self.colors['bg'],
-                               highlightthickness=0)
+                               highlightthickness=0, borderwidth=0, takefocus=0, confine=True)
         left_scrollbar = ttk.Scrollbar(left_column_container, orient='vertical',
                                       command=left_canvas.yview)
 
         # Scrollable frame inside canvas
         left_column = tk.Frame(left_canvas, bg=self.colors['bg'])
 
-        # Configure canvas scrolling
-        def _configure_scroll_region(event=None):
-            left_canvas.configure(scrollregion=left_canvas.bbox('all'))
-
-        left_column.bind('<Configure>', _configure_scroll_region)
-
         # Create canvas window for left_column
-        canvas_window = left_canvas.create_window((0, 0), window=left_column, anchor='nw')
-
-        # Make the frame expand to canvas width
-        def _configure_canvas_width(event):
-            canvas_width = event.width
-            left_canvas.itemconfig(canvas_window, width=canvas_width)
-
-        left_canvas.bind('<Configure>', _configure_canvas_width)
+        left_canvas.create_window((0, 0), window=left_column, anchor='nw', tags='content')
+
+        # One handler keeps the inner frame as wide as the canvas and the scroll region as
+        # tall as the content; Tk is only called when one of them actually changed. The
+        # scrollbar is shown only while the content overflows the viewport.
+        scroll_state = {'width': None, 'region': None, 'scrollbar': False}
+
+        def _sync_scroll(event=None):
+            width = left_canvas.winfo_width()
+            if width != scroll_state['width']:
+                scroll_state['width'] = width
+                left_canvas.itemconfigure('content', width=width)
+
+            content_height = left_column.winfo_reqheight()
+            region = (0, 0, width, content_height)
+            if region != scroll_state['region']:
+                scroll_state['region'] = region
+                left_canvas.configure(scrollregion=region)
+
+            needs_scroll = content_height > left_canvas.winfo_height()
+            if needs_scroll != scroll_state['scrollbar']:
+                scroll_state['scrollbar'] = needs_scroll
+                if needs_scroll:
+                    left_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, before=left_canvas)
+                else:
+                    left_scrollbar.pack_forget()
+                    left_canvas.yview_moveto(0)
+
+        sync_scroll_later = self._debounced(_sync_scroll)
+        left_column.bind('<Configure>', sync_scroll_later)
+        left_canvas.bind('<Configure>', sync_scroll_later)
         left_canvas.configure(yscrollcommand=left_scrollbar.set)
 
-        # Pack canvas and scrollbar
+        # Pack canvas; the scrollbar is packed by _sync_scroll on overflow
         left_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        left_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Bind mousewheel to canvas for scrolling
+        # Mouse wheel scrolls the left column only while the pointer is over it, and not over
+        # widgets that scroll themselves (command/log text). A burst of wheel events is
+        # coalesced into one yview_scroll per frame.
+        wheel = {'delta': 0, 'pending': None}
+        left_canvas_path = str(left_canvas)
+
+        def _flush_mousewheel():
+            wheel['pending'] = None
+            units = int(-1*(wheel['delta']/120))
+            wheel['delta'] += units * 120  # keep the remainder for the next burst
+            if units:
+                left_canvas.yview_scroll(units, "units")
+
         def _on_mousewheel(event):
-            left_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            # Work on the Tcl path only: winfo_containing() would have to map it to a Python
+            # widget, which fails for Tk-internal windows such as a combobox's dropdown list
+            path = str(self.tk.call('winfo', 'containing', event.x_root, event.y_root))
+            if not path.startswith(left_canvas_path):
+                return
+            if self.tk.call('winfo', 'class', path) in ('Text', 'Treeview'):
+                return
+            wheel['delta'] += event.delta
+            if wheel['pending'] is None:
+                wheel['pending'] = self.after(16, _flush_mousewheel)
 
         left_canvas.bind_all("<MouseWheel>", _on_mousewheel)
 
@@ -166,107 +241,119 @@ class App(tk.Tk):
         # Status Bar (Bottom)
         self._create_status_bar()
 
-        # Setup tooltips for all widgets
-        self._setup_tooltips()
+        # Setup tooltips for all widgets once the window has painted; nothing needs them earlier
+        self.after_idle(self._setup_tooltips)
+
+    def _debounced(self, callback, delay=30):
+        """Wrap callback as an event handler that runs it once per burst, ``delay`` ms after the first event"""
+        pending = [None]
+
+        def run():
+            pending[0] = None
+            callback()
+
+        def handler(event=None):
+            if pending[0] is None:
+                pending[0] = self.after(delay, run)
+
+        return handler
 
     def _create_monitoring_section(self, parent):
         """Create the device monitoring panel"""
-        monitor_frame = tk.LabelFrame(parent, text="📊 System Status", bg=self.colors['card_bg'],
-                                      fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+        colors = self.colors
+        card_bg, text_fg, text_light = colors['card_bg'], colors['text'], colors['text_light']
+        monitor_frame = tk.LabelFrame(parent, text="📊 System Status", bg=card_bg,
+                                      fg=text_fg, font=self.F_SECTION,
                                       relief='solid', bd=1, padx=15, pady=10)
-        monitor_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+        monitor_frame.pack(fill=tk.BOTH, expand=True, pady=PAD_CARD)
 
         # Device Status Header with colored indicator
-        device_header = tk.Frame(monitor_frame, bg=self.colors['card_bg'])
+        device_header = tk.Frame(monitor_frame, bg=card_bg)
         device_header.pack(fill=tk.X, pady=(0, 8))
 
-        tk.Label(device_header, text="Connected Devices:", font=('Segoe UI', 9),
-                bg=self.colors['card_bg'], fg=self.colors['text_light']).pack(anchor='w')
+        tk.Label(device_header, text="Connected Devices:", font=self.F_BODY,
+                bg=card_bg, fg=text_light).pack(anchor='w')
 
-        status_row = tk.Frame(device_header, bg=self.colors['card_bg'])
-        status_row.pack(fill=tk.X, pady=(4, 0))
+        status_row = tk.Frame(device_header, bg=card_bg)
+        status_row.pack(fill=tk.X, pady=PAD_ROW)
 
-        self.device_status_indicator = tk.Label(status_row, text="●", font=('Segoe UI', 14),
-                                               bg=self.colors['card_bg'], fg=self.colors['status_disconnected'])
+        self.device_status_indicator = tk.Label(status_row, text="●", font=self.F_INDICATOR,
+                                               bg=card_bg, fg=colors['status_disconnected'])
         self.device_status_indicator.pack(side=tk.LEFT, padx=(0, 5))
 
         self.device_status_label = tk.Label(status_row, text="No devices",
-                                           font=('Segoe UI', 9, 'bold'),
-                                           bg=self.colors['card_bg'], fg=self.colors['text'])
+                                           font=self.F_BOLD,
+                                           bg=card_bg, fg=text_fg)
         self.device_status_label.pack(side=tk.LEFT)
 
-        # Scrollable Device List Frame
-        devices_container = tk.Frame(monitor_frame, bg=self.colors['card_bg'])
+        # Device list: one Treeview row per device, updated in place by serial
+        devices_container = tk.Frame(monitor_frame, bg=card_bg)
         devices_container.pack(fill=tk.BOTH, expand=True, pady=(8, 10))
 
-        # Create a canvas with scrollbar for devices
-        canvas = tk.Canvas(devices_container, bg='#f8f9fa', relief='solid', bd=1,
-                          highlightthickness=0, height=200)
-        scrollbar = ttk.Scrollbar(devices_container, orient='vertical', command=canvas.yview)
-        self.devices_frame = tk.Frame(canvas, bg='#f8f9fa')
-
-        self.devices_frame.bind('<Configure>',
-                               lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
-
-        canvas.create_window((0, 0), window=self.devices_frame, anchor='nw')
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.devices_tree = ttk.Treeview(devices_container, columns=('model', 'serial'),
+                                         show='headings', height=8, selectmode='none',
+                                         style='Devices.Treeview')
+        self.devices_tree.heading('model', text='Model', anchor='w')
+        self.devices_tree.heading('serial', text='Serial', anchor='w')
+        self.devices_tree.column('model', width=130, anchor='w')
+        self.devices_tree.column('serial', width=130, anchor='w')
+        scrollbar = ttk.Scrollbar(devices_container, orient='vertical', command=self.devices_tree.yview)
+        self.devices_tree.configure(yscrollcommand=scrollbar.set)
+
+        self.devices_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._device_rows = {}  # serial -> values currently shown in devices_tree
 
-        # Store canvas for later reference
-        self.devices_canvas = canvas
-
-        # Initial empty state message
-        self.no_devices_label = tk.Label(self.devices_frame,
+        # Empty state message, laid over the (empty) tree
+        self.no_devices_label = tk.Label(devices_container,
                                          text="No devices connected\n\nConnect a device via ADB to see it here",
-                                         font=('Segoe UI', 9), bg='#f8f9fa',
-                                         fg=self.colors['text_light'], pady=40)
-        self.no_devices_label.pack()
+                                         font=self.F_BODY, bg='#f8f9fa',
+                                         fg=text_light)
+        self.no_devices_label.place(relx=0.5, rely=0.55, anchor='center')
 
         # Separator
         ttk.Separator(monitor_frame, orient='horizontal').pack(fill=tk.X, pady=10)
 
         # PC Status with colored indicator
-        pc_container = tk.Frame(monitor_frame, bg=self.colors['card_bg'])
+        pc_container = tk.Frame(monitor_frame, bg=card_bg)
         pc_container.pack(fill=tk.X, pady=8)
 
-        tk.Label(pc_container, text="PC Status:", font=('Segoe UI', 9),
-                bg=self.colors['card_bg'], fg=self.colors['text_light']).pack(anchor='w')
+        tk.Label(pc_container, text="PC Status:", font=self.F_BODY,
+                bg=card_bg, fg=text_light).pack(anchor='w')
 
-        pc_status_row = tk.Frame(pc_container, bg=self.colors['card_bg'])
-        pc_status_row.pack(fill=tk.X, pady=(4, 0))
+        pc_status_row = tk.Frame(pc_container, bg=card_bg)
+        pc_status_row.pack(fill=tk.X, pady=PAD_ROW)
 
-        self.pc_status_indicator = tk.Label(pc_status_row, text="●", font=('Segoe UI', 14),
-                                           bg=self.colors['card_bg'], fg=self.colors['status_online'])
+        self.pc_status_indicator = tk.Label(pc_status_row, text="●", font=self.F_INDICATOR,
+                                           bg=card_bg, fg=colors['status_online'])
         self.pc_status_indicator.pack(side=tk.LEFT, padx=(0, 5))
 
         self.pc_status_label = tk.Label(pc_status_row, text="Online",
-                                       font=('Segoe UI', 9, 'bold'),
-                                       bg=self.colors['card_bg'], fg=self.colors['text'])
+                                       font=self.F_BOLD,
+                                       bg=card_bg, fg=text_fg)
         self.pc_status_label.pack(side=tk.LEFT)
 
         # PC IP
         self.ip_label = self._create_info_label(pc_container, "PC IP:", "N/A")
 
         # Run Zybot Tests Button
-        run_btn_frame = tk.Frame(monitor_frame, bg=self.colors['card_bg'])
+        run_btn_frame = tk.Frame(monitor_frame, bg=card_bg)
         run_btn_frame.pack(fill=tk.X, pady=(15, 5))
 
         self.run_zybot_button = tk.Button(run_btn_frame, text="▶ Run Zybot Tests",
-                                         font=('Segoe UI', 9, 'bold'),
-                                         bg=self.colors['success'], fg='white',
+                                         font=self.F_BOLD,
+                                         bg=colors['success'], fg='white',
                                          relief='flat', cursor='hand2', pady=10,
                                          activebackground='#218838', activeforeground='white')
         self.run_zybot_button.pack(fill=tk.X)
 
         # Kill Process Button
-        kill_btn_frame = tk.Frame(monitor_frame, bg=self.colors['card_bg'])
+        kill_btn_frame = tk.Frame(monitor_frame, bg=card_bg)
         kill_btn_frame.pack(fill=tk.X, pady=(5, 5))
 
         self.kill_button = tk.Button(kill_btn_frame, text="⚠ Kill Process",
-                                     font=('Segoe UI', 9, 'bold'),
-                                     bg=self.colors['danger'], fg='white',
+                                     font=self.F_BOLD,
+                                     bg=colors['danger'], fg='white',
                                      relief='flat', cursor='hand2', pady=8,
                                      activebackground='#c82333', activeforeground='white')
         self.kill_button.pack(fill=tk.X)
@@ -274,86 +361,71 @@ class App(tk.Tk):
     def update_device_list(self, devices_info):
         """Update the device list display with detailed information
 
+        Rows are keyed by serial: existing rows are updated in place, new ones
+        inserted and unplugged ones deleted, so no widgets are rebuilt.
+
         Args:
             devices_info: List of dicts with keys: 'serial', 'model', 'display_name'
         """
-        # Clear existing device widgets
-        for widget in self.devices_frame.winfo_children():
-            widget.destroy()
-
-        if not devices_info:
-            # Show empty state
-            self.no_devices_label = tk.Label(self.devices_frame,
-                                             text="No devices connected\n\nConnect a device via ADB to see it here",
-                                             font=('Segoe UI', 9), bg='#f8f9fa',
-                                             fg=self.colors['text_light'], pady=40)
-            self.no_devices_label.pack()
+        tree = self.devices_tree
+        wanted = {}
+        for device in devices_info:
+            serial = device.get('serial', 'N/A')
+            wanted[serial] = (device.get('model', 'N/A'), serial)
+
+        gone = [serial for serial in self._device_rows if serial not in wanted]
+        if gone:
+            tree.delete(*gone)
+        for serial, values in wanted.items():
+            shown = self._device_rows.get(serial)
+            if shown is None:
+                tree.insert('', tk.END, iid=serial, values=values)
+            elif shown != values:
+                tree.item(serial, values=values)
+        self._device_rows = wanted
+
+        # Keep rows in the order adb reports them
+        order = list(wanted)
+        if list(tree.get_children()) != order:
+            for index, serial in enumerate(order):
+                tree.move(serial, '', index)
+
+        if wanted:
+            self.no_devices_label.place_forget()
         else:
-            # Create a card for each device
-            for idx, device in enumerate(devices_info):
-                device_card = tk.Frame(self.devices_frame, bg='white', relief='solid',
-                                      bd=1, padx=12, pady=10)
-                device_card.pack(fill=tk.X, padx=8, pady=6)
-
-                # Device number/icon
-                header_frame = tk.Frame(device_card, bg='white')
-                header_frame.pack(fill=tk.X)
-
-                tk.Label(header_frame, text=f"📱 Device {idx + 1}",
-                        font=('Segoe UI', 9, 'bold'), bg='white',
-                        fg=self.colors['primary']).pack(side=tk.LEFT)
-
-                # Model
-                model_frame = tk.Frame(device_card, bg='white')
-                model_frame.pack(fill=tk.X, pady=(6, 2))
-                tk.Label(model_frame, text="Model:", font=('Segoe UI', 8),
-                        bg='white', fg=self.colors['text_light']).pack(side=tk.LEFT)
-                tk.Label(model_frame, text=device.get('model', 'N/A'),
-                        font=('Segoe UI', 8, 'bold'), bg='white',
-                        fg=self.colors['text']).pack(side=tk.LEFT, padx=(5, 0))
-
-                # Serial
-                serial_frame = tk.Frame(device_card, bg='white')
-                serial_frame.pack(fill=tk.X, pady=2)
-                tk.Label(serial_frame, text="Serial:", font=('Segoe UI', 8),
-                        bg='white', fg=self.colors['text_light']).pack(side=tk.LEFT)
-                tk.Label(serial_frame, text=device.get('serial', 'N/A'),
-                        font=('Consolas', 8), bg='white',
-                        fg=self.colors['text']).pack(side=tk.LEFT, padx=(5, 0))
+            self.no_devices_label.place(relx=0.5, rely=0.55, anchor='center')
 
     def _create_info_label(self, parent, label_text, value_text):
-        """Helper to create consistent info labels"""
-        container = tk.Frame(parent, bg=self.colors['card_bg'])
-        container.pack(fill=tk.X, pady=4)
-
-        tk.Label(container, text=label_text, font=('Segoe UI', 9),
-                bg=self.colors['card_bg'], fg=self.colors['text_light']).pack(anchor='w')
+        """Helper to create consistent info labels, packed straight into parent (no wrapper frame)"""
+        tk.Label(parent, text=label_text, font=self.F_BODY,
+                bg=self.colors['card_bg'], fg=self.colors['text_light']).pack(anchor='w', pady=(4, 0))
 
-        value_label = tk.Label(container, text=value_text, font=('Segoe UI', 9, 'bold'),
+        value_label = tk.Label(parent, text=value_text, font=self.F_BOLD,
                               bg=self.colors['card_bg'], fg=self.colors['text'])
-        value_label.pack(anchor='w', padx=(10, 0))
+        value_label.pack(anchor='w', padx=(10, 0), pady=(0, 4))
 
         return value_label
 
     def _create_polarion_section(self, parent):
         """Create the Polarion test run section"""
         polarion_frame = tk.LabelFrame(parent, text="🎯 Polarion Test Run", bg=self.colors['card_bg'],
-                                      fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+                                      fg=self.colors['text'], font=self.F_SECTION,
                                       relief='solid', bd=1, padx=15, pady=10)
-        polarion_frame.pack(fill=tk.X, pady=(0, 15))
+        polarion_frame.pack(fill=tk.X, pady=PAD_CARD)
 
         input_frame = tk.Frame(polarion_frame, bg=self.colors['card_bg'])
         input_frame.pack(fill=tk.X, pady=5)
 
-        tk.Label(input_frame, text="Test Run URL:", font=('Segoe UI', 9),
+        tk.Label(input_frame, text="Test Run URL:", font=self.F_BODY,
                 bg=self.colors['card_bg'], fg=self.colors['text']).pack(side=tk.LEFT, padx=(0, 10))
 
-        self.polarion_url_entry = tk.Entry(input_frame, font=('Segoe UI', 9),
+        self.polarion_url_var = tk.StringVar()
+        self.polarion_url_entry = tk.Entry(input_frame, textvariable=self.polarion_url_var, font=self.F_BODY,
                                            relief='solid', bd=1, bg='white')
         self.polarion_url_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=4, padx=(0, 10))
 
         self.download_sttls_button = tk.Button(input_frame, text="📥 Download STTLs",
-                                              font=('Segoe UI', 9, 'bold'),
+                                              font=self.F_BOLD,
                                               bg=self.colors['primary'], fg='white',
                                               relief='flat', cursor='hand2', padx=15, pady=6,
                                               activebackground=self.colors['primary_hover'])
@@ -363,19 +435,20 @@ class App(tk.Tk):
         custom_sttl_frame = tk.Frame(polarion_frame, bg=self.colors['card_bg'])
         custom_sttl_frame.pack(fill=tk.X, pady=(10, 5))
 
-        tk.Label(custom_sttl_frame, text="Or enter STTLs manually:", font=('Segoe UI', 9),
+        tk.Label(custom_sttl_frame, text="Or enter STTLs manually:", font=self.F_BODY,
                 bg=self.colors['card_bg'], fg=self.colors['text']).pack(anchor='w', pady=(0, 5))
 
         # Input row with entry and button
         input_row = tk.Frame(custom_sttl_frame, bg=self.colors['card_bg'])
         input_row.pack(fill=tk.X)
 
-        self.custom_sttl_entry = tk.Entry(input_row, font=('Segoe UI', 9),
+        self.custom_sttl_var = tk.StringVar()
+        self.custom_sttl_entry = tk.Entry(input_row, textvariable=self.custom_sttl_var, font=self.F_BODY,
                                           relief='solid', bd=1, bg='white')
         self.custom_sttl_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=4, padx=(0, 10))
 
         self.parse_sttls_button = tk.Button(input_row, text="🔄 Parse STTLs",
-                                           font=('Segoe UI', 9, 'bold'),
+                                           font=self.F_BOLD,
                                            bg=self.colors['primary'], fg='white',
                                            relief='flat', cursor='hand2', padx=15, pady=6,
                                            activebackground=self.colors['primary_hover'])
@@ -384,33 +457,36 @@ class App(tk.Tk):
         # Add helper text
         helper_label = tk.Label(custom_sttl_frame,
                                text="Format: id:(STTL/STTL-205890 STTL/STTL-205891) or comma-separated",
-                               font=('Segoe UI', 8), bg=self.colors['card_bg'],
+                               font=self.F_SMALL, bg=self.colors['card_bg'],
                                fg=self.colors['text_light'])
         helper_label.pack(anchor='w', pady=(2, 0))
 
     def _create_zybot_section(self, parent):
         """Create the Zybot execution section"""
-        zybot_frame = tk.LabelFrame(parent, text="🤖 Zybot Test Execution", bg=self.colors['card_bg'],
-                                   fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+        colors = self.colors
+        card_bg, text_fg = colors['card_bg'], colors['text']
+        zybot_frame = tk.LabelFrame(parent, text="🤖 Zybot Test Execution", bg=card_bg,
+                                   fg=text_fg, font=self.F_SECTION,
                                    relief='solid', bd=1, padx=15, pady=10)
-        zybot_frame.pack(fill=tk.X, pady=(0, 15))
+        zybot_frame.pack(fill=tk.X, pady=PAD_CARD)
 
         # Device selection in a 2x2 grid
-        device_grid = tk.Frame(zybot_frame, bg=self.colors['card_bg'])
+        device_grid = tk.Frame(zybot_frame, bg=card_bg)
         device_grid.pack(fill=tk.X, pady=5)
 
         self.device_dropdowns = {}
+        self._last_dropdown_values = None  # options last pushed by update_device_dropdowns
         for i in range(1, 5):
             row = (i - 1) // 2
             col = (i - 1) % 2
 
-            device_container = tk.Frame(device_grid, bg=self.colors['card_bg'])
+            device_container = tk.Frame(device_grid, bg=card_bg)
             device_container.grid(row=row, column=col, padx=8, pady=6, sticky='ew')
 
-            tk.Label(device_container, text=f"DUT{i}:", font=('Segoe UI', 9),
-                    bg=self.colors['card_bg'], fg=self.colors['text'], width=6, anchor='w').pack(side=tk.LEFT)
+            tk.Label(device_container, text=f"DUT{i}:", font=self.F_BODY,
+                    bg=card_bg, fg=text_fg, width=6, anchor='w').pack(side=tk.LEFT)
 
-            device_dropdown = ttk.Combobox(device_container, width=22, font=('Segoe UI', 9))
+            device_dropdown = ttk.Combobox(device_container, width=22, font=self.F_BODY)
             device_dropdown.pack(side=tk.LEFT, fill=tk.X, expand=True)
             self.device_dropdowns[f"DUT{i}"] = device_dropdown
 
@@ -420,9 +496,9 @@ class App(tk.Tk):
     def _create_command_section(self, parent):
         """Create the generated command display section"""
         command_frame = tk.LabelFrame(parent, text="💻 Generated Zybot Command", bg=self.colors['card_bg'],
-                                     fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+                                     fg=self.colors['text'], font=self.F_SECTION,
                                      relief='solid', bd=1, padx=15, pady=10)
-        command_frame.pack(fill=tk.X, pady=(0, 15))
+        command_frame.pack(fill=tk.X, pady=PAD_CARD)
 
         # Add checkbox for custom command mode
         checkbox_frame = tk.Frame(command_frame, bg=self.colors['card_bg'])
@@ -432,7 +508,7 @@ class App(tk.Tk):
         custom_cmd_checkbox = tk.Checkbutton(checkbox_frame,
                                             text="Use custom command",
                                             variable=self.use_custom_command,
-                                            font=('Segoe UI', 9),
+                                            font=self.F_BODY,
                                             bg=self.colors['card_bg'],
                                             fg=self.colors['text'],
                                             activebackground=self.colors['card_bg'],
@@ -441,33 +517,38 @@ class App(tk.Tk):
         custom_cmd_checkbox.pack(side=tk.LEFT)
 
         self.zybot_command_text = scrolledtext.ScrolledText(command_frame, wrap=tk.WORD, height=4,
-                                                            font=('Consolas', 9), bg='#f8f9fa',
+                                                            font=self.F_MONO, bg='#f8f9fa',
                                                             relief='solid', bd=1, padx=8, pady=8)
         self.zybot_command_text.pack(fill=tk.X, expand=True)
         self.zybot_command_text.configure(state='disabled')
 
     def _create_jfrog_section(self, parent):
         """Create the JFrog Artifactory section"""
-        jfrog_frame = tk.LabelFrame(parent, text="📦 JFrog Artifactory", bg=self.colors['card_bg'],
-                                   fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+        colors = self.colors
+        card_bg, text_fg, text_light = colors['card_bg'], colors['text'], colors['text_light']
+        primary = colors['primary']
+        jfrog_frame = tk.LabelFrame(parent, text="📦 JFrog Artifactory", bg=card_bg,
+                                   fg=text_fg, font=self.F_SECTION,
                                    relief='solid', bd=1, padx=15, pady=10)
-        jfrog_frame.pack(fill=tk.X, pady=(0, 15))
+        jfrog_frame.pack(fill=tk.X, pady=PAD_CARD)
 
         # Device Selection
-        device_selection_frame = tk.Frame(jfrog_frame, bg=self.colors['card_bg'])
-        device_selection_frame.pack(fill=tk.X, pady=(5, 10))
+        device_selection_frame = tk.Frame(jfrog_frame, bg=card_bg)
+        device_selection_frame.pack(fill=tk.X, pady=PAD_GROUP)
 
-        tk.Label(device_selection_frame, text="Target Device:", font=('Segoe UI', 9),
-                bg=self.colors['card_bg'], fg=self.colors['text']).pack(side=tk.LEFT, padx=(0, 10))
+        tk.Label(device_selection_frame, text="Target Device:", font=self.F_BODY,
+                bg=card_bg, fg=text_fg).pack(side=tk.LEFT, padx=(0, 10))
 
         self.flash_device_dropdown = ttk.Combobox(device_selection_frame, width=30,
-                                                  font=('Segoe UI', 9), state='readonly')
+                                                  font=self.F_BODY, state='readonly')
         self.flash_device_dropdown.pack(side=tk.LEFT, ipady=2)
         self.flash_device_dropdown['values'] = ['']  # Will be updated by monitoring daemon
+        self._last_flash_values = None  # options last pushed by update_flash_device_dropdown
+        self.flash_device_serials = {}  # "Model (serial)" option -> serial
 
         # Progress bar and label (initially hidden)
-        progress_container = tk.Frame(jfrog_frame, bg=self.colors['card_bg'])
-        progress_container.pack(fill=tk.X, pady=(5, 10))
+        progress_container = tk.Frame(jfrog_frame, bg=card_bg)
+        progress_container.pack(fill=tk.X, pady=PAD_GROUP)
 
         self.progress_bar = ttk.Progressbar(
             progress_container,
@@ -479,9 +560,9 @@ class App(tk.Tk):
         self.progress_label = tk.Label(
             progress_container,
             text="",
-            font=('Segoe UI', 8),
-            bg=self.colors['card_bg'],
-            fg=self.colors['text_light']
+            font=self.F_SMALL,
+            bg=card_bg,
+            fg=text_light
         )
         self.progress_label.pack(fill=tk.X)
 
@@ -490,30 +571,30 @@ class App(tk.Tk):
         self.progress_container = progress_container
 
         # Build URL input section
-        url_input_frame = tk.Frame(jfrog_frame, bg=self.colors['card_bg'])
-        url_input_frame.pack(fill=tk.X, pady=(5, 10))
+        url_input_frame = tk.Frame(jfrog_frame, bg=card_bg)
+        url_input_frame.pack(fill=tk.X, pady=PAD_GROUP)
 
-        tk.Label(url_input_frame, text="Build URL:", font=('Segoe UI', 9),
-                bg=self.colors['card_bg'], fg=self.colors['text']).pack(anchor='w', pady=(0, 5))
+        tk.Label(url_input_frame, text="Build URL:", font=self.F_BODY,
+                bg=card_bg, fg=text_fg).pack(anchor='w', pady=(0, 5))
 
-        self.jfrog_link_entry = tk.Entry(url_input_frame, font=('Segoe UI', 9),
+        self.jfrog_link_entry = tk.Entry(url_input_frame, font=self.F_BODY,
                                          relief='solid', bd=1, bg='white')
         self.jfrog_link_entry.pack(fill=tk.X, ipady=4)
 
         # Build URL action buttons
-        url_buttons_frame = tk.Frame(jfrog_frame, bg=self.colors['card_bg'])
-        url_buttons_frame.pack(fill=tk.X, pady=(5, 10))
+        url_buttons_frame = tk.Frame(jfrog_frame, bg=card_bg)
+        url_buttons_frame.pack(fill=tk.X, pady=PAD_GROUP)
 
         self.download_build_button = tk.Button(url_buttons_frame, text="📥 Download Only",
-                                              font=('Segoe UI', 9, 'bold'),
-                                              bg=self.colors['primary'], fg='white',
+                                              font=self.F_BOLD,
+                                              bg=primary, fg='white',
                                               relief='flat', cursor='hand2', padx=12, pady=6,
-                                              activebackground=self.colors['primary_hover'])
+                                              activebackground=colors['primary_hover'])
         self.download_build_button.pack(side=tk.LEFT, padx=(0, 8))
 
         self.download_flash_button = tk.Button(url_buttons_frame, text="⚡ Download & Flash",
-                                              font=('Segoe UI', 9, 'bold'),
-                                              bg=self.colors['warning'], fg='#212529',
+                                              font=self.F_BOLD,
+                                              bg=colors['warning'], fg='#212529',
                                               relief='flat', cursor='hand2', padx=12, pady=6,
                                               activebackground='#e0a800')
         self.download_flash_button.pack(side=tk.LEFT)
@@ -522,29 +603,29 @@ class App(tk.Tk):
         ttk.Separator(jfrog_frame, orient='horizontal').pack(fill=tk.X, pady=10)
 
         # Local file flash section
-        local_file_frame = tk.Frame(jfrog_frame, bg=self.colors['card_bg'])
+        local_file_frame = tk.Frame(jfrog_frame, bg=card_bg)
         local_file_frame.pack(fill=tk.X, pady=5)
 
-        tk.Label(local_file_frame, text="Local Build File:", font=('Segoe UI', 9),
-                bg=self.colors['card_bg'], fg=self.colors['text']).pack(anchor='w', pady=(0, 5))
+        tk.Label(local_file_frame, text="Local Build File:", font=self.F_BODY,
+                bg=card_bg, fg=text_fg).pack(anchor='w', pady=(0, 5))
 
-        file_input_row = tk.Frame(local_file_frame, bg=self.colors['card_bg'])
+        file_input_row = tk.Frame(local_file_frame, bg=card_bg)
         file_input_row.pack(fill=tk.X)
 
-        self.local_file_entry = tk.Entry(file_input_row, font=('Segoe UI', 9),
+        self.local_file_entry = tk.Entry(file_input_row, font=self.F_BODY,
                                          relief='solid', bd=1, bg='white')
         self.local_file_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=4, padx=(0, 8))
 
         self.browse_button = tk.Button(file_input_row, text="📁 Browse",
-                                       font=('Segoe UI', 9),
+                                       font=self.F_BODY,
                                        bg='#6c757d', fg='white',
                                        relief='flat', cursor='hand2', padx=12, pady=6,
                                        activebackground='#5a6268')
         self.browse_button.pack(side=tk.LEFT, padx=(0, 8))
 
         self.flash_local_button = tk.Button(file_input_row, text="⚡ Flash",
-                                           font=('Segoe UI', 9, 'bold'),
-                                           bg=self.colors['success'], fg='white',
+                                           font=self.F_BOLD,
+                                           bg=colors['success'], fg='white',
                                            relief='flat', cursor='hand2', padx=12, pady=6,
                                            activebackground='#218838')
         self.flash_local_button.pack(side=tk.LEFT)
@@ -552,27 +633,27 @@ class App(tk.Tk):
     def _create_scheduler_section(self, parent):
         """Create the scheduled tasks management section"""
         scheduler_frame = tk.LabelFrame(parent, text="🕐 Scheduled Tasks", bg=self.colors['card_bg'],
-                                       fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+                                       fg=self.colors['text'], font=self.F_SECTION,
                                        relief='solid', bd=1, padx=15, pady=10)
-        scheduler_frame.pack(fill=tk.X, pady=(0, 15))
+        scheduler_frame.pack(fill=tk.X, pady=PAD_CARD)
 
         # Header with status and controls
         header_frame = tk.Frame(scheduler_frame, bg=self.colors['card_bg'])
-        header_frame.pack(fill=tk.X, pady=(5, 10))
+        header_frame.pack(fill=tk.X, pady=PAD_GROUP)
 
         # Scheduler status indicator
         status_frame = tk.Frame(header_frame, bg=self.colors['card_bg'])
         status_frame.pack(side=tk.LEFT)
 
-        tk.Label(status_frame, text="Status:", font=('Segoe UI', 9),
+        tk.Label(status_frame, text="Status:", font=self.F_BODY,
                 bg=self.colors['card_bg'], fg=self.colors['text_light']).pack(side=tk.LEFT, padx=(0, 5))
 
-        self.scheduler_status_indicator = tk.Label(status_frame, text="●", font=('Segoe UI', 12),
+        self.scheduler_status_indicator = tk.Label(status_frame, text="●", font=self.F_INDICATOR_SMALL,
                                                    bg=self.colors['card_bg'], fg=self.colors['status_disconnected'])
         self.scheduler_status_indicator.pack(side=tk.LEFT, padx=(0, 5))
 
         self.scheduler_status_label = tk.Label(status_frame, text="Stopped",
-                                              font=('Segoe UI', 9, 'bold'),
+                                              font=self.F_BOLD,
                                               bg=self.colors['card_bg'], fg=self.colors['text'])
         self.scheduler_status_label.pack(side=tk.LEFT)
 
@@ -581,14 +662,14 @@ class App(tk.Tk):
         control_frame.pack(side=tk.RIGHT)
 
         self.scheduler_start_button = tk.Button(control_frame, text="▶ Start",
-                                               font=('Segoe UI', 8, 'bold'),
+                                               font=self.F_SMALL_BOLD,
                                                bg=self.colors['success'], fg='white',
                                                relief='flat', cursor='hand2', padx=10, pady=4,
                                                activebackground='#218838')
         self.scheduler_start_button.pack(side=tk.LEFT, padx=(0, 5))
 
         self.scheduler_stop_button = tk.Button(control_frame, text="⏸ Stop",
-                                              font=('Segoe UI', 8, 'bold'),
+                                              font=self.F_SMALL_BOLD,
                                               bg=self.colors['warning'], fg='#212529',
                                               relief='flat', cursor='hand2', padx=10, pady=4,
                                               activebackground='#e0a800')
@@ -596,7 +677,7 @@ class App(tk.Tk):
 
         # Task list container
         task_list_container = tk.Frame(scheduler_frame, bg=self.colors['card_bg'])
-        task_list_container.pack(fill=tk.BOTH, expand=True, pady=(5, 10))
+        task_list_container.pack(fill=tk.BOTH, expand=True, pady=PAD_GROUP)
 
         # Scrollable task list
         task_canvas = tk.Canvas(task_list_container, bg='#f8f9fa', relief='solid', bd=1,
@@ -604,8 +685,8 @@ class App(tk.Tk):
         task_scrollbar = ttk.Scrollbar(task_list_container, orient='vertical', command=task_canvas.yview)
         self.tasks_frame = tk.Frame(task_canvas, bg='#f8f9fa')
 
-        self.tasks_frame.bind('<Configure>',
-                             lambda e: task_canvas.configure(scrollregion=task_canvas.bbox('all')))
+        self.tasks_frame.bind('<Configure>', self._debounced(
+            lambda: task_canvas.configure(scrollregion=task_canvas.bbox('all'))))
 
         task_canvas.create_window((0, 0), window=self.tasks_frame, anchor='nw')
         task_canvas.configure(yscrollcommand=task_scrollbar.set)
@@ -619,7 +700,7 @@ class App(tk.Tk):
         # Initial empty state message
         self.no_tasks_label = tk.Label(self.tasks_frame,
                                        text="No scheduled tasks\n\nClick 'Add Task' to create a new scheduled task",
-                                       font=('Segoe UI', 9), bg='#f8f9fa',
+                                       font=self.F_BODY, bg='#f8f9fa',
                                        fg=self.colors['text_light'], pady=30)
         self.no_tasks_label.pack()
 
@@ -628,7 +709,7 @@ class App(tk.Tk):
         add_task_frame.pack(fill=tk.X, pady=(5, 0))
 
         self.add_task_button = tk.Button(add_task_frame, text="➕ Add Task",
-                                        font=('Segoe UI', 9, 'bold'),
+                                        font=self.F_BOLD,
                                         bg=self.colors['primary'], fg='white',
                                         relief='flat', cursor='hand2', pady=8,
                                         activebackground=self.colors['primary_hover'])
@@ -637,9 +718,9 @@ class App(tk.Tk):
     def _create_log_section(self, parent):
         """Create the log display section"""
         log_frame = tk.LabelFrame(parent, text="📋 System Logs", bg=self.colors['card_bg'],
-                                 fg=self.colors['text'], font=('Segoe UI', 10, 'bold'),
+                                 fg=self.colors['text'], font=self.F_SECTION,
                                  relief='solid', bd=1, padx=15, pady=10)
-        log_frame.pack(fill=tk.X, pady=(0, 15))
+        log_frame.pack(fill=tk.X, pady=PAD_CARD)
 
         # Log controls
         controls_frame = tk.Frame(log_frame, bg=self.colors['card_bg'])
@@ -647,7 +728,7 @@ class App(tk.Tk):
 
         # Log level filter
         tk.Label(controls_frame, text="Show:", bg=self.colors['card_bg'],
-                font=('Segoe UI', 8)).pack(side=tk.LEFT, padx=(0, 5))
+                font=self.F_SMALL).pack(side=tk.LEFT, padx=(0, 5))
 
         self.log_level_var = tk.StringVar(value='all')
         levels = [('All', 'all'), ('Info', 'info'), ('Success', 'success'), ('Errors', 'error')]
@@ -659,14 +740,14 @@ class App(tk.Tk):
                 variable=self.log_level_var,
                 value=level,
                 bg=self.colors['card_bg'],
-                font=('Segoe UI', 8),
+                font=self.F_SMALL,
                 selectcolor=self.colors['card_bg']
             ).pack(side=tk.LEFT, padx=2)
 
         # Search box
         tk.Label(controls_frame, text="Search:", bg=self.colors['card_bg'],
-                font=('Segoe UI', 8)).pack(side=tk.LEFT, padx=(15, 5))
-        self.log_search_entry = tk.Entry(controls_frame, width=15, font=('Segoe UI', 8))
+                font=self.F_SMALL).pack(side=tk.LEFT, padx=(15, 5))
+        self.log_search_entry = tk.Entry(controls_frame, width=15, font=self.F_SMALL)
         self.log_search_entry.pack(side=tk.LEFT, padx=(0, 10))
 
         # Auto-scroll checkbox
@@ -676,7 +757,7 @@ class App(tk.Tk):
             text="Auto-scroll",
             variable=self.auto_scroll,
             bg=self.colors['card_bg'],
-            font=('Segoe UI', 8),
+            font=self.F_SMALL,
             selectcolor=self.colors['card_bg']
         ).pack(side=tk.LEFT, padx=5)
 
@@ -684,7 +765,7 @@ class App(tk.Tk):
         self.export_logs_button = tk.Button(
             controls_frame,
             text="💾 Export",
-            font=('Segoe UI', 8),
+            font=self.F_SMALL,
             bg=self.colors['primary'],
             fg='white',
             relief='flat',
@@ -698,7 +779,7 @@ class App(tk.Tk):
         self.clear_logs_button = tk.Button(
             controls_frame,
             text="🗑️ Clear",
-            font=('Segoe UI', 8),
+            font=self.F_SMALL,
             bg='#6c757d',
             fg='white',
             relief='flat',
@@ -708,9 +789,9 @@ class App(tk.Tk):
         )
         self.clear_logs_button.pack(side=tk.RIGHT, padx=2)
 
-        # Log text area
-        self.log_text = scrolledtext.ScrolledText(log_frame, wrap=tk.WORD, height=12,
-                                                  font=('Consolas', 9), bg='#ffffff', fg='#212529',
+        # Log text area (no undo stack: the log is append-only and read-only for the user)
+        self.log_text = scrolledtext.ScrolledText(log_frame, wrap=tk.WORD, height=12, undo=False, maxundo=0,
+                                                  font=self.F_MONO, bg='#ffffff', fg='#212529',
                                                   relief='solid', bd=1, padx=8, pady=8,
                                                   insertbackground='#212529')
         self.log_text.pack(fill=tk.BOTH, expand=True)
@@ -725,7 +806,7 @@ class App(tk.Tk):
             anchor='w',
             padx=15,
             pady=8,
-            font=('Segoe UI', 9),
+            font=self.F_BODY,
             relief='flat',
             bd=1
         )
@@ -765,26 +846,48 @@ class App(tk.Tk):
         frame.pack(fill=tk.BOTH, expand=True)
 
         tk.Label(frame, text=f"{icon} {message}", bg=bg_color, fg='white',
-                font=('Segoe UI', 10), wraplength=250, justify='left').pack()
+                font=self.F_LARGE, wraplength=250, justify='left').pack()
 
         toast.deiconify()
         toast.lift()
         toast.after(duration, toast.destroy)
 
+    def post_ui(self, key, callback, *args):
+        """Queue a widget update from any thread; per drain only the latest update for a key runs"""
+        self._ui_queue.put((key, callback, args))
+
+    def _drain_ui_queue(self):
+        """Apply the updates posted since the last drain, coalesced per key"""
+        batch = {}
+        while True:
+            try:
+                key, callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.pop(key, None)  # last one wins and takes the latest position
+            batch[key] = (callback, args)
+
+        self.after(UI_DRAIN_INTERVAL, self._drain_ui_queue)
+        for callback, args in batch.values():
+            callback(*args)
+
     def update_progress(self, current, total, operation="Operation"):
-        """Update progress bar and label
+        """Update progress bar and label (safe to call from worker threads)
 
         Args:
             current: Current progress value (bytes)
             total: Total value (bytes)
             operation: Operation description
         """
+        self.post_ui('progress', self._show_progress, current, total, operation)
+
+    def _show_progress(self, current, total, operation):
         if not hasattr(self, 'progress_container'):
             return
 
         # Show progress container if hidden
         if not self.progress_container.winfo_ismapped():
-            self.progress_container.pack(fill=tk.X, pady=(5, 10), after=self.flash_device_dropdown.master)
+            self.progress_container.pack(fill=tk.X, pady=PAD_GROUP, after=self.flash_device_dropdown.master)
 
         percentage = (current / total) * 100 if total > 0 else 0
         self.progress_bar['value'] = percentage
@@ -795,10 +898,12 @@ class App(tk.Tk):
         self.progress_label.config(
             text=f"{operation}... {current_mb:.1f} MB / {total_mb:.1f} MB ({percentage:.1f}%)"
         )
-        self.update_idletasks()
 
     def hide_progress(self):
-        """Hide progress bar"""
+        """Hide progress bar (safe to call from worker threads)"""
+        self.post_ui('progress', self._hide_progress)
+
+    def _hide_progress(self):
         if hasattr(self, 'progress_container'):
             self.progress_container.pack_forget()
             self.progress_bar['value'] = 0
@@ -870,12 +975,15 @@ class App(tk.Tk):
         add_tooltip(self.export_logs_button,
                    "Export logs to text file\nShortcut: Ctrl+S")
 
-    def update_scheduled_tasks_list(self, tasks):
+    def update_scheduled_tasks_list(self, tasks, on_toggle=None, on_edit=None, on_delete=None):
         """Update the scheduled tasks list display
         
         Args:
             tasks: List of ScheduledTask objects
+            on_toggle, on_edit, on_delete: Callbacks for the card buttons, called with the task_id
         """
+        colors = self.colors
+        text_fg, text_light, primary = colors['text'], colors['text_light'], colors['primary']
         # Clear existing task widgets
         for widget in self.tasks_frame.winfo_children():
             widget.destroy()
@@ -884,10 +992,16 @@ class App(tk.Tk):
             # Show empty state
             self.no_tasks_label = tk.Label(self.tasks_frame,
                                           text="No scheduled tasks\n\nClick 'Add Task' to create a new scheduled task",
-                                          font=('Segoe UI', 9), bg='#f8f9fa',
-                                          fg=self.colors['text_light'], pady=30)
+                                          font=self.F_BODY, bg='#f8f9fa',
+                                          fg=text_light, pady=30)
             self.no_tasks_label.pack()
         else:
+            # Task type badge colors
+            type_colors = {
+                'flash': '#17a2b8',
+                'test': '#6f42c1',
+                'flash_and_test': '#fd7e14'
+            }
             # Create a card for each task
             for idx, task in enumerate(tasks):
                 task_card = tk.Frame(self.tasks_frame, bg='white', relief='solid',
@@ -899,89 +1013,100 @@ class App(tk.Tk):
                 header_frame.pack(fill=tk.X)
 
                 # Status indicator
-                status_color = self.colors['success'] if task.enabled else self.colors['text_light']
-                tk.Label(header_frame, text="●", font=('Segoe UI', 10),
+                status_color = colors['success'] if task.enabled else text_light
+                tk.Label(header_frame, text="●", font=self.F_LARGE,
                         bg='white', fg=status_color).pack(side=tk.LEFT, padx=(0, 5))
 
                 # Task name
                 tk.Label(header_frame, text=task.name,
-                        font=('Segoe UI', 9, 'bold'), bg='white',
-                        fg=self.colors['text']).pack(side=tk.LEFT)
+                        font=self.F_BOLD, bg='white',
+                        fg=text_fg).pack(side=tk.LEFT)
 
                 # Task type badge
-                type_colors = {
-                    'flash': '#17a2b8',
-                    'test': '#6f42c1',
-                    'flash_and_test': '#fd7e14'
-                }
-                badge_color = type_colors.get(task.task_type, self.colors['text_light'])
+                badge_color = type_colors.get(task.task_type, text_light)
                 tk.Label(header_frame, text=task.task_type.replace('_', ' ').title(),
-                        font=('Segoe UI', 7, 'bold'), bg=badge_color, fg='white',
+                        font=self.F_TINY_BOLD, bg=badge_color, fg='white',
                         padx=6, pady=2).pack(side=tk.LEFT, padx=(10, 0))
 
                 # Schedule info
                 schedule_frame = tk.Frame(task_card, bg='white')
                 schedule_frame.pack(fill=tk.X, pady=(4, 2))
 
-                tk.Label(schedule_frame, text="Schedule:", font=('Segoe UI', 8),
-                        bg='white', fg=self.colors['text_light']).pack(side=tk.LEFT)
+                tk.Label(schedule_frame, text="Schedule:", font=self.F_SMALL,
+                        bg='white', fg=text_light).pack(side=tk.LEFT)
                 
                 schedule_text = f"{task.schedule_type.title()}: {task.schedule_value}"
                 tk.Label(schedule_frame, text=schedule_text,
-                        font=('Segoe UI', 8), bg='white',
-                        fg=self.colors['text']).pack(side=tk.LEFT, padx=(5, 0))
+                        font=self.F_SMALL, bg='white',
+                        fg=text_fg).pack(side=tk.LEFT, padx=(5, 0))
 
                 # Next run time
                 if task.next_run:
                     next_run_frame = tk.Frame(task_card, bg='white')
                     next_run_frame.pack(fill=tk.X, pady=2)
 
-                    tk.Label(next_run_frame, text="Next run:", font=('Segoe UI', 8),
-                            bg='white', fg=self.colors['text_light']).pack(side=tk.LEFT)
+                    tk.Label(next_run_frame, text="Next run:", font=self.F_SMALL,
+                            bg='white', fg=text_light).pack(side=tk.LEFT)
                     
                     next_run_str = task.next_run.strftime("%Y-%m-%d %H:%M")
                     tk.Label(next_run_frame, text=next_run_str,
-                            font=('Consolas', 8), bg='white',
-                            fg=self.colors['primary']).pack(side=tk.LEFT, padx=(5, 0))
+                            font=self.F_MONO_SMALL, bg='white',
+                            fg=primary).pack(side=tk.LEFT, padx=(5, 0))
 
                 # Action buttons
                 actions_frame = tk.Frame(task_card, bg='white')
-                actions_frame.pack(fill=tk.X, pady=(4, 0))
-
-                # Store task_id on the card for callbacks
-                task_card.task_id = task.task_id
+                actions_frame.pack(fill=tk.X, pady=PAD_ROW)
 
                 # Enable/Disable button
                 toggle_text = "⏸ Disable" if task.enabled else "▶ Enable"
                 toggle_btn = tk.Button(actions_frame, text=toggle_text,
-                                      font=('Segoe UI', 7), bg='#6c757d', fg='white',
+                                      font=self.F_TINY, bg='#6c757d', fg='white',
                                       relief='flat', cursor='hand2', padx=8, pady=2)
                 toggle_btn.pack(side=tk.LEFT, padx=(0, 4))
-                toggle_btn.task_id = task.task_id
-                # Callback will be set in main.py
 
                 # Edit button
-                edit_btn = tk.Button(actions_frame, text="✏️ Edit",
-                                    font=('Segoe UI', 7), bg=self.colors['primary'], fg='white',
+                edit_btn = tk.Button(actions_frame, text="✎ Edit",
+                                    font=self.F_TINY, bg=primary, fg='white',
                                     relief='flat', cursor='hand2', padx=8, pady=2)
                 edit_btn.pack(side=tk.LEFT, padx=(0, 4))
-                edit_btn.task_id = task.task_id
-                # Callback will be set in main.py
 
                 # Delete button
-                delete_btn = tk.Button(actions_frame, text="🗑️ Delete",
-                                      font=('Segoe UI', 7), bg=self.colors['danger'], fg='white',
+                delete_btn = tk.Button(actions_frame, text="✕ Delete",
+                                      font=self.F_TINY, bg=colors['danger'], fg='white',
                                       relief='flat', cursor='hand2', padx=8, pady=2)
                 delete_btn.pack(side=tk.LEFT)
-                delete_btn.task_id = task.task_id
-                # Callback will be set in main.py
+
+                # Bind the callbacks as the buttons are created
+                for button, callback in ((toggle_btn, on_toggle), (edit_btn, on_edit), (delete_btn, on_delete)):
+                    if callback:
+                        button.config(command=lambda tid=task.task_id, cb=callback: cb(tid))
 
     def update_device_dropdowns(self, devices):
-        """Update the device dropdown options"""
-        device_list = [""] + devices
+        """Update the device dropdown options, skipping the Tk calls if nothing changed"""
+        device_list = ("",) + tuple(devices)
+        if device_list == self._last_dropdown_values:
+            return
+        self._last_dropdown_values = device_list
         for dropdown in self.device_dropdowns.values():
             dropdown['values'] = device_list
 
+    def update_flash_device_dropdown(self, devices_info):
+        """Update the flash target options; a single device is preselected, none clears it
+
+        Args:
+            devices_info: List of dicts with keys: 'serial', 'model', 'display_name'
+        """
+        device_list = tuple(device['display_name'] for device in devices_info)
+        if device_list == self._last_flash_values:
+            return
+        self._last_flash_values = device_list
+        self.flash_device_serials = {device['display_name']: device['serial'] for device in devices_info}
+        self.flash_device_dropdown['values'] = device_list
+        if len(device_list) == 1:
+            self.flash_device_dropdown.set(device_list[0])
+        elif not device_list:
+            self.flash_device_dropdown.set('')
+
 if __name__ == "__main__":
     app = App()
     app.mainloop()
@@ -1,10 +1,29 @@
 """
 Task configuration dialog for scheduled tasks
 """
+import functools
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, font
 import uuid
 
+# Fixed dialog size (not resizable)
+DIALOG_WIDTH = 600
+DIALOG_HEIGHT = 800
+
+# Dialog palette
+DIALOG_BG = '#f5f5f5'
+CARD_BG = 'white'
+HINT_FG = '#6c757d'
+
+WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+INTERVAL_UNITS = (('m', 'Minutes'), ('h', 'Hours'), ('d', 'Days'))
+
+
+@functools.lru_cache(maxsize=None)
+def _font(size, weight='normal'):
+    """Named Segoe UI font, created once and shared by every dialog instance"""
+    return font.Font(family='Segoe UI', size=size, weight=weight)
+
 
 class TaskConfigDialog(tk.Toplevel):
     """Dialog for creating or editing scheduled tasks"""
@@ -24,21 +43,27 @@ class TaskConfigDialog(tk.Toplevel):
         self.result = None
         self.available_products = available_products or []
 
+        # Schedule inputs; the daily and weekly frames share the time variables
+        self.hour_var = tk.StringVar(value='14')
+        self.minute_var = tk.StringVar(value='00')
+        self.day_var = tk.StringVar(value='Wednesday')
+        self.interval_value_var = tk.StringVar(value='6')
+        self.interval_unit_var = tk.StringVar(value='h')
+
         # Configure window
         self.title("Configure Scheduled Task" if not task else f"Edit Task: {task.name}")
-        self.geometry("600x800")
         self.resizable(False, False)
 
+        # Size and center on parent in one call; the dialog size is fixed, so there is
+        # no need to flush pending layout just to measure it
+        x = parent.winfo_x() + (parent.winfo_width() - DIALOG_WIDTH) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - DIALOG_HEIGHT) // 2
+        self.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}+{x}+{y}")
+
         # Make dialog modal
         self.transient(parent)
         self.grab_set()
 
-        # Center on parent
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
-        self.geometry(f"+{x}+{y}")
-
         self.create_widgets()
 
         # Load existing task data if editing
@@ -48,15 +73,15 @@ class TaskConfigDialog(tk.Toplevel):
     def create_widgets(self):
         """Create dialog widgets"""
         # Main container with canvas for scrolling
-        main_frame = tk.Frame(self, bg='#f5f5f5')
+        main_frame = tk.Frame(self, bg=DIALOG_BG)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Create canvas and scrollbar for scrollable content
-        canvas = tk.Canvas(main_frame, bg='#f5f5f5', highlightthickness=0)
+        canvas = tk.Canvas(main_frame, bg=DIALOG_BG, highlightthickness=0)
         scrollbar = ttk.Scrollbar(main_frame, orient='vertical', command=canvas.yview)
 
         # Scrollable container
-        container = tk.Frame(canvas, bg='#f5f5f5', padx=20, pady=20)
+        container = tk.Frame(canvas, bg=DIALOG_BG, padx=20, pady=20)
 
         # Configure canvas
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -66,10 +91,18 @@ class TaskConfigDialog(tk.Toplevel):
         # Create window in canvas
         canvas_window = canvas.create_window((0, 0), window=container, anchor='nw')
 
-        # Configure scroll region when container changes size
-        def configure_scroll_region(event=None):
+        # Configure scroll region when container changes size. Every pack() while the dialog is
+        # being built fires <Configure>, so the bbox scan is deferred to idle and done once
+        scroll_region_pending = []
+
+        def apply_scroll_region():
+            scroll_region_pending.clear()
             canvas.configure(scrollregion=canvas.bbox('all'))
 
+        def configure_scroll_region(event=None):
+            if not scroll_region_pending:
+                scroll_region_pending.append(canvas.after_idle(apply_scroll_region))
+
         container.bind('<Configure>', configure_scroll_region)
 
         # Make canvas expand to window width
@@ -78,102 +111,106 @@ class TaskConfigDialog(tk.Toplevel):
 
         canvas.bind('<Configure>', configure_canvas_width)
 
-        # Bind mousewheel for scrolling
+        # Mousewheel scrolling, bound on this Toplevel's tag so it only sees events from the
+        # dialog's own widgets and goes away with it (bind_all would also replace the main
+        # window's handler for good)
         def on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            return "break"
 
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+        self.bind("<MouseWheel>", on_mousewheel)
 
         # Task Name
-        name_frame = tk.LabelFrame(container, text="Task Name", bg='white', padx=10, pady=10)
+        name_frame = tk.LabelFrame(container, text="Task Name", bg=CARD_BG, padx=10, pady=10)
         name_frame.pack(fill=tk.X, pady=(0, 10))
 
         self.name_var = tk.StringVar()
-        name_entry = tk.Entry(name_frame, textvariable=self.name_var, font=('Segoe UI', 10))
+        name_entry = tk.Entry(name_frame, textvariable=self.name_var, font=_font(10))
         name_entry.pack(fill=tk.X)
         tk.Label(name_frame, text="Give your task a descriptive name",
-                font=('Segoe UI', 8), fg='#6c757d', bg='white').pack(anchor='w', pady=(2, 0))
+                font=_font(8), fg=HINT_FG, bg=CARD_BG).pack(anchor='w', pady=(2, 0))
 
         # Task Type
-        type_frame = tk.LabelFrame(container, text="Task Type", bg='white', padx=10, pady=10)
+        type_frame = tk.LabelFrame(container, text="Task Type", bg=CARD_BG, padx=10, pady=10)
         type_frame.pack(fill=tk.X, pady=(0, 10))
 
         self.task_type_var = tk.StringVar(value='flash_and_test')
 
         tk.Radiobutton(type_frame, text="Flash Build Only", variable=self.task_type_var,
-                      value='flash', bg='white', font=('Segoe UI', 9)).pack(anchor='w')
+                      value='flash', bg=CARD_BG, font=_font(9)).pack(anchor='w')
         tk.Radiobutton(type_frame, text="Run Tests Only", variable=self.task_type_var,
-                      value='test', bg='white', font=('Segoe UI', 9)).pack(anchor='w')
+                      value='test', bg=CARD_BG, font=_font(9)).pack(anchor='w')
         tk.Radiobutton(type_frame, text="Flash Build and Run Tests", variable=self.task_type_var,
-                      value='flash_and_test', bg='white', font=('Segoe UI', 9)).pack(anchor='w')
+                      value='flash_and_test', bg=CARD_BG, font=_font(9)).pack(anchor='w')
 
         # Schedule Configuration
-        schedule_frame = tk.LabelFrame(container, text="Schedule", bg='white', padx=10, pady=10)
+        schedule_frame = tk.LabelFrame(container, text="Schedule", bg=CARD_BG, padx=10, pady=10)
         schedule_frame.pack(fill=tk.X, pady=(0, 10))
 
         self.schedule_type_var = tk.StringVar(value='weekly')
 
         # Schedule type selection
-        schedule_type_frame = tk.Frame(schedule_frame, bg='white')
+        schedule_type_frame = tk.Frame(schedule_frame, bg=CARD_BG)
         schedule_type_frame.pack(fill=tk.X, pady=(0, 10))
 
         tk.Radiobutton(schedule_type_frame, text="Daily", variable=self.schedule_type_var,
                       value='daily', command=self.update_schedule_inputs,
-                      bg='white', font=('Segoe UI', 9)).pack(side=tk.LEFT, padx=(0, 10))
+                      bg=CARD_BG, font=_font(9)).pack(side=tk.LEFT, padx=(0, 10))
         tk.Radiobutton(schedule_type_frame, text="Weekly", variable=self.schedule_type_var,
                       value='weekly', command=self.update_schedule_inputs,
-                      bg='white', font=('Segoe UI', 9)).pack(side=tk.LEFT, padx=(0, 10))
+                      bg=CARD_BG, font=_font(9)).pack(side=tk.LEFT, padx=(0, 10))
         tk.Radiobutton(schedule_type_frame, text="Interval", variable=self.schedule_type_var,
                       value='interval', command=self.update_schedule_inputs,
-                      bg='white', font=('Segoe UI', 9)).pack(side=tk.LEFT)
+                      bg=CARD_BG, font=_font(9)).pack(side=tk.LEFT)
 
         # Schedule configuration container (changes based on type)
-        self.schedule_config_frame = tk.Frame(schedule_frame, bg='white')
+        self.schedule_config_frame = tk.Frame(schedule_frame, bg=CARD_BG)
         self.schedule_config_frame.pack(fill=tk.X)
 
+        self._schedule_frames = self._create_schedule_frames(self.schedule_config_frame)
         self.update_schedule_inputs()
 
         # Build Configuration
-        build_frame = tk.LabelFrame(container, text="Build Configuration", bg='white', padx=10, pady=10)
+        build_frame = tk.LabelFrame(container, text="Build Configuration", bg=CARD_BG, padx=10, pady=10)
         build_frame.pack(fill=tk.X, pady=(0, 10))
 
-        tk.Label(build_frame, text="Build URL or Product Path:", font=('Segoe UI', 9),
-                bg='white').pack(anchor='w', pady=(0, 5))
+        tk.Label(build_frame, text="Build URL or Product Path:", font=_font(9),
+                bg=CARD_BG).pack(anchor='w', pady=(0, 5))
 
         self.build_url_var = tk.StringVar()
-        build_entry = tk.Entry(build_frame, textvariable=self.build_url_var, font=('Segoe UI', 9))
+        build_entry = tk.Entry(build_frame, textvariable=self.build_url_var, font=_font(9))
         build_entry.pack(fill=tk.X)
 
         tk.Label(build_frame, text="Use 'latest' in URL to automatically get the newest build",
-                font=('Segoe UI', 8), fg='#6c757d', bg='white').pack(anchor='w', pady=(2, 0))
+                font=_font(8), fg=HINT_FG, bg=CARD_BG).pack(anchor='w', pady=(2, 0))
 
         # Test Configuration (optional)
-        test_frame = tk.LabelFrame(container, text="Test Configuration (Optional)", bg='white', padx=10, pady=10)
+        test_frame = tk.LabelFrame(container, text="Test Configuration (Optional)", bg=CARD_BG, padx=10, pady=10)
         test_frame.pack(fill=tk.X, pady=(0, 10))
 
-        tk.Label(test_frame, text="Polarion Test Run URL:", font=('Segoe UI', 9),
-                bg='white').pack(anchor='w', pady=(0, 5))
+        tk.Label(test_frame, text="Polarion Test Run URL:", font=_font(9),
+                bg=CARD_BG).pack(anchor='w', pady=(0, 5))
 
         self.test_url_var = tk.StringVar()
-        test_entry = tk.Entry(test_frame, textvariable=self.test_url_var, font=('Segoe UI', 9))
+        test_entry = tk.Entry(test_frame, textvariable=self.test_url_var, font=_font(9))
         test_entry.pack(fill=tk.X, pady=(0, 5))
 
-        tk.Label(test_frame, text="Test Suite Name:", font=('Segoe UI', 9),
-                bg='white').pack(anchor='w', pady=(5, 5))
+        tk.Label(test_frame, text="Test Suite Name:", font=_font(9),
+                bg=CARD_BG).pack(anchor='w', pady=(5, 5))
 
         self.test_suite_var = tk.StringVar()
-        test_suite_entry = tk.Entry(test_frame, textvariable=self.test_suite_var, font=('Segoe UI', 9))
+        test_suite_entry = tk.Entry(test_frame, textvariable=self.test_suite_var, font=_font(9))
         test_suite_entry.pack(fill=tk.X)
 
         # Device Configuration
-        device_frame = tk.LabelFrame(container, text="Device Configuration", bg='white', padx=10, pady=10)
+        device_frame = tk.LabelFrame(container, text="Device Configuration", bg=CARD_BG, padx=10, pady=10)
         device_frame.pack(fill=tk.X, pady=(0, 10))
 
-        tk.Label(device_frame, text="Target Device (serial or 'any'):", font=('Segoe UI', 9),
-                bg='white').pack(anchor='w', pady=(0, 5))
+        tk.Label(device_frame, text="Target Device (serial or 'any'):", font=_font(9),
+                bg=CARD_BG).pack(anchor='w', pady=(0, 5))
 
         self.device_var = tk.StringVar(value='any')
-        device_entry = tk.Entry(device_frame, textvariable=self.device_var, font=('Segoe UI', 9))
+        device_entry = tk.Entry(device_frame, textvariable=self.device_var, font=_font(9))
         device_entry.pack(fill=tk.X)
 
         # Buttons in a fixed footer (outside scrollable area)
@@ -185,89 +222,73 @@ class TaskConfigDialog(tk.Toplevel):
         button_inner.pack(fill=tk.X, padx=20, pady=15)
 
         cancel_btn = tk.Button(button_inner, text="✖ Cancel", command=self.cancel,
-                              font=('Segoe UI', 10), bg='#6c757d', fg='white',
+                              font=_font(10), bg='#6c757d', fg='white',
                               padx=25, pady=10, relief='flat', cursor='hand2',
                               activebackground='#5a6268')
         cancel_btn.pack(side=tk.RIGHT, padx=(5, 0))
 
         save_btn = tk.Button(button_inner, text="✓ Save Task", command=self.save_task,
-                            font=('Segoe UI', 10, 'bold'), bg='#0066cc', fg='white',
+                            font=_font(10, 'bold'), bg='#0066cc', fg='white',
                             padx=25, pady=10, relief='flat', cursor='hand2',
                             activebackground='#0052a3')
         save_btn.pack(side=tk.RIGHT)
 
-    def update_schedule_inputs(self):
-        """Update schedule input fields based on selected schedule type"""
-        # Clear existing widgets
-        for widget in self.schedule_config_frame.winfo_children():
-            widget.destroy()
-
-        schedule_type = self.schedule_type_var.get()
-
-        if schedule_type == 'daily':
-            # Time input for daily schedule
-            tk.Label(self.schedule_config_frame, text="Time (HH:MM):", font=('Segoe UI', 9),
-                    bg='white').pack(anchor='w', pady=(5, 5))
-
-            time_frame = tk.Frame(self.schedule_config_frame, bg='white')
-            time_frame.pack(anchor='w')
-
-            self.hour_var = tk.StringVar(value='14')
-            self.minute_var = tk.StringVar(value='00')
+    def _create_time_inputs(self, parent):
+        """HH:MM spinboxes bound to the shared hour/minute variables"""
+        tk.Label(parent, text="Time (HH:MM):", font=_font(9),
+                bg=CARD_BG).pack(anchor='w', pady=(5, 5))
 
-            tk.Spinbox(time_frame, from_=0, to=23, textvariable=self.hour_var,
-                      width=5, font=('Segoe UI', 10)).pack(side=tk.LEFT)
-            tk.Label(time_frame, text=":", font=('Segoe UI', 12), bg='white').pack(side=tk.LEFT, padx=2)
-            tk.Spinbox(time_frame, from_=0, to=59, textvariable=self.minute_var,
-                      width=5, font=('Segoe UI', 10)).pack(side=tk.LEFT)
+        time_frame = tk.Frame(parent, bg=CARD_BG)
+        time_frame.pack(anchor='w')
 
-        elif schedule_type == 'weekly':
-            # Day and time input for weekly schedule
-            tk.Label(self.schedule_config_frame, text="Day of Week:", font=('Segoe UI', 9),
-                    bg='white').pack(anchor='w', pady=(5, 5))
+        tk.Spinbox(time_frame, from_=0, to=23, textvariable=self.hour_var,
+                  width=5, font=_font(10)).pack(side=tk.LEFT)
+        tk.Label(time_frame, text=":", font=_font(12), bg=CARD_BG).pack(side=tk.LEFT, padx=2)
+        tk.Spinbox(time_frame, from_=0, to=59, textvariable=self.minute_var,
+                  width=5, font=_font(10)).pack(side=tk.LEFT)
 
-            self.day_var = tk.StringVar(value='Wednesday')
-            day_combo = ttk.Combobox(self.schedule_config_frame, textvariable=self.day_var,
-                                    values=['Monday', 'Tuesday', 'Wednesday', 'Thursday',
-                                           'Friday', 'Saturday', 'Sunday'],
-                                    state='readonly', width=15)
-            day_combo.pack(anchor='w', pady=(0, 10))
+    def _create_schedule_frames(self, parent):
+        """Build the daily/weekly/interval inputs once; update_schedule_inputs only shows one of them"""
+        # Time input for daily schedule
+        daily_frame = tk.Frame(parent, bg=CARD_BG)
+        self._create_time_inputs(daily_frame)
 
-            tk.Label(self.schedule_config_frame, text="Time (HH:MM):", font=('Segoe UI', 9),
-                    bg='white').pack(anchor='w', pady=(5, 5))
+        # Day and time input for weekly schedule
+        weekly_frame = tk.Frame(parent, bg=CARD_BG)
+        tk.Label(weekly_frame, text="Day of Week:", font=_font(9),
+                bg=CARD_BG).pack(anchor='w', pady=(5, 5))
+        ttk.Combobox(weekly_frame, textvariable=self.day_var, values=WEEKDAYS,
+                    state='readonly', width=15).pack(anchor='w', pady=(0, 10))
+        self._create_time_inputs(weekly_frame)
 
-            time_frame = tk.Frame(self.schedule_config_frame, bg='white')
-            time_frame.pack(anchor='w')
+        # Interval input
+        interval_frame = tk.Frame(parent, bg=CARD_BG)
+        tk.Label(interval_frame, text="Run every:", font=_font(9),
+                bg=CARD_BG).pack(anchor='w', pady=(5, 5))
 
-            self.hour_var = tk.StringVar(value='14')
-            self.minute_var = tk.StringVar(value='00')
+        interval_row = tk.Frame(interval_frame, bg=CARD_BG)
+        interval_row.pack(anchor='w')
 
-            tk.Spinbox(time_frame, from_=0, to=23, textvariable=self.hour_var,
-                      width=5, font=('Segoe UI', 10)).pack(side=tk.LEFT)
-            tk.Label(time_frame, text=":", font=('Segoe UI', 12), bg='white').pack(side=tk.LEFT, padx=2)
-            tk.Spinbox(time_frame, from_=0, to=59, textvariable=self.minute_var,
-                      width=5, font=('Segoe UI', 10)).pack(side=tk.LEFT)
+        tk.Spinbox(interval_row, from_=1, to=999, textvariable=self.interval_value_var,
+                  width=5, font=_font(10)).pack(side=tk.LEFT, padx=(0, 5))
 
-        elif schedule_type == 'interval':
-            # Interval input
-            tk.Label(self.schedule_config_frame, text="Run every:", font=('Segoe UI', 9),
-                    bg='white').pack(anchor='w', pady=(5, 5))
+        ttk.Combobox(interval_row, textvariable=self.interval_unit_var,
+                    values=INTERVAL_UNITS,
+                    state='readonly', width=10).pack(side=tk.LEFT)
 
-            interval_frame = tk.Frame(self.schedule_config_frame, bg='white')
-            interval_frame.pack(anchor='w')
+        tk.Label(interval_frame, text="(m=minutes, h=hours, d=days)",
+                font=_font(8), fg=HINT_FG, bg=CARD_BG).pack(anchor='w', pady=(2, 0))
 
-            self.interval_value_var = tk.StringVar(value='6')
-            self.interval_unit_var = tk.StringVar(value='h')
+        return {'daily': daily_frame, 'weekly': weekly_frame, 'interval': interval_frame}
 
-            tk.Spinbox(interval_frame, from_=1, to=999, textvariable=self.interval_value_var,
-                      width=5, font=('Segoe UI', 10)).pack(side=tk.LEFT, padx=(0, 5))
-
-            ttk.Combobox(interval_frame, textvariable=self.interval_unit_var,
-                        values=[('m', 'Minutes'), ('h', 'Hours'), ('d', 'Days')],
-                        state='readonly', width=10).pack(side=tk.LEFT)
-
-            tk.Label(self.schedule_config_frame, text="(m=minutes, h=hours, d=days)",
-                    font=('Segoe UI', 8), fg='#6c757d', bg='white').pack(anchor='w', pady=(2, 0))
+    def update_schedule_inputs(self):
+        """Show the schedule input fields for the selected schedule type"""
+        active = self._schedule_frames.get(self.schedule_type_var.get())
+        for frame in self._schedule_frames.values():
+            if frame is not active:
+                frame.pack_forget()
+        if active is not None:
+            active.pack(fill=tk.X)
 
     def load_task_data(self):
         """Load existing task data into form"""
@@ -306,6 +327,7 @@ class TaskConfigDialog(tk.Toplevel):
         self.test_suite_var.set(config.get('test_suite', ''))
         self.device_var.set(config.get('device', 'any'))
 
+        # Show the frame for the loaded schedule type
         self.update_schedule_inputs()
 
     def save_task(self):
@@ -326,15 +348,13 @@ class TaskConfigDialog(tk.Toplevel):
         schedule_value = ''
 
         try:
-            if schedule_type == 'daily':
+            if schedule_type in ('daily', 'weekly'):
+                # Both read the shared time spinboxes; weekly prefixes the day
                 hour = int(self.hour_var.get())
                 minute = int(self.minute_var.get())
                 schedule_value = f"{hour:02d}:{minute:02d}"
-            elif schedule_type == 'weekly':
-                day = self.day_var.get()
-                hour = int(self.hour_var.get())
-                minute = int(self.minute_var.get())
-                schedule_value = f"{day} {hour:02d}:{minute:02d}"
+                if schedule_type == 'weekly':
+                    schedule_value = f"{self.day_var.get()} {schedule_value}"
             elif schedule_type == 'interval':
                 value = int(self.interval_value_var.get())
                 unit = self.interval_unit_var.get()
@@ -1,9 +1,11 @@
 import tkinter as tk  # Required for tk.END constant
-from tkinter import filedialog, messagebox
+from tkinter import messagebox
 import configparser
-from threading import Thread, Event
+from threading import Event
+from concurrent.futures import ThreadPoolExecutor
 import os
-import json
+import re
+import functools
 
 from gui.main_window import App
 from gui.task_dialog import TaskConfigDialog
@@ -15,12 +17,94 @@ from core.artifactory import ArtifactoryManager
 from core.scheduler import TaskScheduler, ScheduledTask
 from core.web_server import get_web_server
 from utils.logger import Logger
+from utils.fast_json import dumps as json_dumps, loads as json_loads
+
+# Project-level files live next to src/; resolved once at import
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_PATH = os.path.join(PROJECT_ROOT, 'config.ini')
+SCHEDULED_TASKS_FILE = os.path.join(PROJECT_ROOT, 'scheduled_tasks.json')
+SESSION_FILE = os.path.join(PROJECT_ROOT, 'session_state.json')
+BUILDS_DIR = os.path.join(PROJECT_ROOT, 'builds')
+
+# Quiet time after the last keystroke in the URL/STTL entries before the command preview is rebuilt
+COMMAND_TYPING_DEBOUNCE_MS = 150
+# Same for the log search box
+LOG_SEARCH_DEBOUNCE_MS = 200
+
+# Level tags the logger puts on each line of the log widget
+LOG_LEVEL_TAGS = ('info', 'success', 'warning', 'error')
+# Lines copied from the log widget per write when exporting
+EXPORT_CHUNK_LINES = 1000
+
+# Custom STTL input: the id:(...) wrapper and the token delimiters (space, comma, newline)
+STTL_ID_RE = re.compile(r'id:\s*\((.*?)\)')
+STTL_SPLIT_RE = re.compile(r'[,\s\n]+')
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_custom_sttls(custom_input):
+    """Cached parser behind MainApplication.parse_custom_sttls; returns an (immutable) tuple"""
+    if not custom_input or not custom_input.strip():
+        return ()
+
+    sttls, seen = [], set()  # seen keeps the de-duplication O(1) per token
+
+    # Check if it's in id:(...) format
+    id_match = STTL_ID_RE.search(custom_input)
+    if id_match:
+        content = id_match.group(1)
+    else:
+        content = custom_input
+
+    # Split by common delimiters (space, comma, newline)
+    tokens = STTL_SPLIT_RE.split(content)
+
+    for token in tokens:
+        token = token.strip()
+        if not token:
+            continue
+
+        # Extract STTL ID, handling STTL/ prefix
+        if 'STTL/' in token:
+            # Extract ID after the last STTL/
+            sttl_id = token.rpartition('STTL/')[2]
+        elif token.startswith('STTL-'):
+            # Already in correct format
+            sttl_id = token
+        elif token.startswith('STTL'):
+            # Add hyphen if missing
+            sttl_id = 'STTL-' + token[4:]
+        elif token.replace('-', '').isdigit():
+            # Just the number (digits, optionally with dashes), add STTL- prefix
+            sttl_id = 'STTL-' + token
+        else:
+            # Skip invalid tokens
+            continue
+
+        # Clean up any trailing characters
+        sttl_id = sttl_id.rstrip('*').strip()
+
+        if sttl_id and sttl_id not in seen:
+            seen.add(sttl_id)
+            sttls.append(sttl_id)
+
+    return tuple(sttls)
+
+
+def polarion_run_name_from_url(url):
+    """Last path segment of a Polarion test run URL (scans from the end, no list of segments)"""
+    return url.rpartition('/')[2]
+
+
+def serial_from_device_label(label):
+    """Serial out of a "Model (serial)" device option, without building intermediate lists"""
+    return label.partition('(')[2].partition(')')[0]
+
 
 class MainApplication:
     def __init__(self):
         self.config = configparser.ConfigParser()
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.ini')
-        self.config.read(config_path)
+        self.config.read(CONFIG_PATH)
 
         self.app = App()
         self.logger = Logger(self.app.log_text, self.app.auto_scroll)
@@ -33,13 +117,26 @@ class MainApplication:
         self.monitor_daemon = MonitorDaemon(self.app)
         self.monitor_daemon.start()
 
-        self.current_thread = None
+        # One worker runs the long GUI-triggered operations; the buttons are disabled meanwhile
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='operation')
+        self.current_future = None
         self.stop_event = Event()  # For graceful thread cancellation
 
+        self._command_update_pending = False  # a command preview refresh is queued for idle
+        self._command_typing_after_id = None  # debounce timer for typing in the URL/STTL entries
+        self._log_search_after_id = None  # debounce timer for typing in the log search box
+        self._log_search_term = ''  # term currently highlighted in the visible part of the log
+        self._log_highlight_pending = False  # a re-highlight of the log view is queued for idle
+
+        # Scheduled task type -> runner taking the task config
+        self._task_handlers = {
+            'flash': self._run_flash_config,
+            'test': self._run_test_config,
+            'flash_and_test': self._run_flash_and_test_config,
+        }
+
         # Initialize task scheduler BEFORE setup_callbacks
-        scheduler_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                                     'scheduled_tasks.json')
-        self.task_scheduler = TaskScheduler(scheduler_file)
+        self.task_scheduler = TaskScheduler(SCHEDULED_TASKS_FILE)
         self.task_scheduler.set_logger(self.logger)
         self.task_scheduler.set_task_executor(self.execute_scheduled_task)
 
@@ -55,6 +152,10 @@ class MainApplication:
         self.setup_placeholders()
         self.restore_session_state()
 
+    def _custom_sttl_text(self):
+        """Stripped custom STTL input, read once from the entry's variable"""
+        return self.app.custom_sttl_var.get().strip()
+
     def parse_custom_sttls(self, custom_input):
         """Parse custom STTL input in various formats
 
@@ -67,57 +168,11 @@ class MainApplication:
         Returns:
             list: List of STTL IDs (e.g., ['STTL-205890', 'STTL-205891'])
         """
-        import re
-
-        if not custom_input or not custom_input.strip():
-            return []
-
-        sttls = []
-
-        # Check if it's in id:(...) format
-        id_match = re.search(r'id:\s*\((.*?)\)', custom_input)
-        if id_match:
-            content = id_match.group(1)
-        else:
-            content = custom_input
-
-        # Split by common delimiters (space, comma, newline)
-        tokens = re.split(r'[,\s\n]+', content)
-
-        for token in tokens:
-            token = token.strip()
-            if not token:
-                continue
-
-            # Extract STTL ID, handling STTL/ prefix
-            if 'STTL/' in token:
-                # Extract ID after STTL/
-                sttl_id = token.split('STTL/')[-1]
-            elif token.startswith('STTL-'):
-                # Already in correct format
-                sttl_id = token
-            elif token.startswith('STTL'):
-                # Add hyphen if missing
-                sttl_id = token.replace('STTL', 'STTL-', 1)
-            else:
-                # Assume it's just the number, add STTL- prefix
-                if token.isdigit() or (token.replace('-', '').isdigit()):
-                    sttl_id = f"STTL-{token}"
-                else:
-                    # Skip invalid tokens
-                    continue
-
-            # Clean up any trailing characters
-            sttl_id = sttl_id.rstrip('*').strip()
-
-            if sttl_id and sttl_id not in sttls:
-                sttls.append(sttl_id)
-
-        return sttls
+        return list(_parse_custom_sttls(custom_input))
 
     def parse_and_display_sttls(self):
         """Parse custom STTLs and display the formatted result"""
-        custom_input = self.app.custom_sttl_entry.get().strip()
+        custom_input = self._custom_sttl_text()
 
         if not custom_input:
             messagebox.showwarning("No Input",
@@ -165,14 +220,18 @@ class MainApplication:
         # Add callbacks for device dropdowns to update the command
         for dropdown in self.app.device_dropdowns.values():
             dropdown.bind("<<ComboboxSelected>>", self.update_zybot_command_display)
-        self.app.polarion_url_entry.bind("<KeyRelease>", self.update_zybot_command_display)
-        self.app.custom_sttl_entry.bind("<KeyRelease>", self.update_zybot_command_display)
+        # Traces fire only when the text actually changes (not on arrow/modifier keys)
+        self.app.polarion_url_var.trace_add('write', lambda *args: self._schedule_zybot_command_update())
+        self.app.custom_sttl_var.trace_add('write', lambda *args: self._schedule_zybot_command_update())
 
         # Log controls callbacks
         self.app.clear_logs_button.config(command=self.clear_logs)
         self.app.export_logs_button.config(command=self.export_logs)
         self.app.log_level_var.trace('w', lambda *args: self.filter_logs())
-        self.app.log_search_entry.bind('<KeyRelease>', lambda e: self.search_logs())
+        self.app.log_search_entry.bind('<KeyRelease>', self._schedule_log_search)
+        self.app.log_text.tag_config('search_highlight', background='yellow', foreground='black')
+        # Search highlights only cover the visible lines, so re-apply them whenever the view moves
+        self.app.log_text.config(yscrollcommand=self._on_log_view_changed)
 
         # Scheduler callbacks
         self.app.scheduler_start_button.config(command=self.start_scheduler)
@@ -183,29 +242,58 @@ class MainApplication:
         self.refresh_scheduled_tasks_display()
 
     def update_zybot_command_display(self, event=None):
+        """Schedule a command preview refresh; a burst of key/selection events is coalesced into one"""
+        if self._command_update_pending:
+            return
+        self._command_update_pending = True
+        self.app.after_idle(self._refresh_zybot_command_display)
+
+    def _schedule_zybot_command_update(self, event=None):
+        """Refresh the command preview once typing pauses for COMMAND_TYPING_DEBOUNCE_MS"""
+        if self._command_typing_after_id is not None:
+            self.app.after_cancel(self._command_typing_after_id)
+        self._command_typing_after_id = self.app.after(COMMAND_TYPING_DEBOUNCE_MS, self._on_command_typing_paused)
+
+    def _on_command_typing_paused(self):
+        self._command_typing_after_id = None
+        self.update_zybot_command_display()
+
+    def _refresh_zybot_command_display(self):
+        self._command_update_pending = False
+
         # Don't update if custom command mode is enabled
         if self.app.use_custom_command.get():
             return
 
-        polarion_run_name = self.app.polarion_url_entry.get().split('/')[-1]
-        devices = {dut: dropdown.get() for dut, dropdown in self.app.device_dropdowns.items() if dropdown.get()}
+        # The placeholder text is not a URL
+        polarion_url = '' if self.app.polarion_url_entry.cget('fg') == '#999999' else self.app.polarion_url_entry.get()
+        polarion_run_name = polarion_run_name_from_url(polarion_url)
+        devices = {dut: device for dut, dropdown in self.app.device_dropdowns.items() if (device := dropdown.get())}
 
         # Check if custom STTLs are provided
-        custom_sttl_input = self.app.custom_sttl_entry.get().strip()
+        custom_sttl_input = self._custom_sttl_text()
         if custom_sttl_input:
             # Use custom STTLs
             sttls = self.parse_custom_sttls(custom_sttl_input)
-            self.logger.log(f"Using custom STTLs: {sttls}", level='info')
         else:
             # Fall back to downloaded STTLs
             sttls = getattr(self, 'sttls', [])
 
         command = self.zybot_executor.get_command_string(polarion_run_name, devices, sttls)
+        # Compare with what the widget shows (it may have been edited in custom mode)
+        command_text = self.app.zybot_command_text
+        if command_text.get('1.0', 'end-1c') == command:
+            return
+
+        if custom_sttl_input:
+            self.logger.log(f"Using custom STTLs: {sttls}", level='info')
 
-        self.app.zybot_command_text.configure(state='normal')
-        self.app.zybot_command_text.delete(1.0, tk.END)
-        self.app.zybot_command_text.insert(tk.END, command)
-        self.app.zybot_command_text.configure(state='disabled')
+        command_text.configure(state='normal')
+        try:
+            command_text.delete(1.0, tk.END)
+            command_text.insert(tk.END, command)
+        finally:
+            command_text.configure(state='disabled')
 
     def run_download_sttls(self):
         if not self.validate_polarion_input():
@@ -213,8 +301,7 @@ class MainApplication:
 
         self.disable_action_buttons()
         self.stop_event.clear()
-        self.current_thread = Thread(target=self._download_sttls_thread)
-        self.current_thread.start()
+        self.current_future = self._executor.submit(self._download_sttls_thread)
 
     def _download_sttls_thread(self):
         try:
@@ -243,8 +330,7 @@ class MainApplication:
 
         self.disable_action_buttons()
         self.stop_event.clear()
-        self.current_thread = Thread(target=self._run_zybot_tests_thread)
-        self.current_thread.start()
+        self.current_future = self._executor.submit(self._run_zybot_tests_thread)
 
     def _run_zybot_tests_thread(self):
         try:
@@ -283,11 +369,11 @@ class MainApplication:
                 return
 
             # Standard mode - use auto-generated command
-            polarion_run_name = self.app.polarion_url_entry.get().split('/')[-1]
+            polarion_run_name = polarion_run_name_from_url(self.app.polarion_url_entry.get())
             devices = {dut: dropdown.get() for dut, dropdown in self.app.device_dropdowns.items()}
 
             # Check if custom STTLs are provided
-            custom_sttl_input = self.app.custom_sttl_entry.get().strip()
+            custom_sttl_input = self._custom_sttl_text()
             if custom_sttl_input:
                 # Use custom STTLs
                 sttls = self.parse_custom_sttls(custom_sttl_input)
@@ -304,7 +390,7 @@ class MainApplication:
                 return
 
             # Notify web server that tests are starting
-            device_list = [v.split('(')[1].split(')')[0] if '(' in v else v
+            device_list = [serial_from_device_label(v) if '(' in v else v
                           for v in devices.values() if v]
             self.web_server.start_test_execution(
                 test_name=polarion_run_name,
@@ -351,9 +437,12 @@ class MainApplication:
         selected = self.app.flash_device_dropdown.get()
         if not selected:
             return None
-        # Format is "Model (serial)" - extract serial from parentheses
+        serial = self.app.flash_device_serials.get(selected)
+        if serial:
+            return serial
+        # Not a listed device (e.g. restored from the last session): format is "Model (serial)"
         if '(' in selected and ')' in selected:
-            return selected.split('(')[1].split(')')[0]
+            return serial_from_device_label(selected)
         return None
 
     def run_download_build(self):
@@ -363,8 +452,7 @@ class MainApplication:
 
         self.disable_action_buttons()
         self.stop_event.clear()
-        self.current_thread = Thread(target=self._download_build_thread)
-        self.current_thread.start()
+        self.current_future = self._executor.submit(self._download_build_thread)
 
     def _download_build_thread(self):
         try:
@@ -400,8 +488,7 @@ class MainApplication:
 
         self.disable_action_buttons()
         self.stop_event.clear()
-        self.current_thread = Thread(target=self._download_and_flash_thread)
-        self.current_thread.start()
+        self.current_future = self._executor.submit(self._download_and_flash_thread)
 
     def _download_and_flash_thread(self):
         try:
@@ -431,13 +518,10 @@ class MainApplication:
 
     def browse_local_file(self):
         """Open file browser to select a local build file"""
-        # Use project root builds directory for consistency
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        builds_dir = os.path.join(project_root, "builds")
+        from tkinter import filedialog  # Only needed once a file dialog is opened
 
-        # Create builds directory if it doesn't exist
-        if not os.path.exists(builds_dir):
-            os.makedirs(builds_dir)
+        # Use project root builds directory for consistency, creating it if it doesn't exist
+        os.makedirs(BUILDS_DIR, exist_ok=True)
 
         file_path = filedialog.askopenfilename(
             title="Select Build File",
@@ -445,7 +529,7 @@ class MainApplication:
                 ("ZIP files", "*.zip"),
                 ("All files", "*.*")
             ],
-            initialdir=builds_dir
+            initialdir=BUILDS_DIR
         )
         if file_path:
             self.app.local_file_entry.delete(0, tk.END)
@@ -469,8 +553,7 @@ class MainApplication:
 
         self.disable_action_buttons()
         self.stop_event.clear()
-        self.current_thread = Thread(target=self._flash_local_thread)
-        self.current_thread.start()
+        self.current_future = self._executor.submit(self._flash_local_thread)
 
     def _flash_local_thread(self):
         try:
@@ -500,14 +583,19 @@ class MainApplication:
 
     def kill_current_process(self):
         """Request graceful thread termination"""
-        if self.current_thread and self.current_thread.is_alive():
+        if self.is_operation_running():
             self.stop_event.set()
+            self.current_future.cancel()  # Only takes effect if it has not started yet
             self.logger.log("⚠️ Termination requested. Attempting to stop operation gracefully...", level='warning')
             # Re-enable buttons after a short delay
             self.app.after(2000, self.enable_action_buttons)
         else:
             self.logger.log("No active operation to terminate.", level='info')
 
+    def is_operation_running(self):
+        """Whether a submitted operation is still queued or running"""
+        return self.current_future is not None and not self.current_future.done()
+
     # ===== BUTTON STATE MANAGEMENT =====
 
     def disable_action_buttons(self):
@@ -529,6 +617,8 @@ class MainApplication:
         self.app.browse_button.config(state='normal', bg='#6c757d')
         self.app.flash_local_button.config(state='normal', bg=self.app.colors['success'])
         self.app.update_status_bar("✅ Ready")
+        # Devices often reboot or re-enumerate after an operation; don't wait for the next poll
+        self.monitor_daemon.notify()
 
     # ===== INPUT VALIDATION =====
 
@@ -562,7 +652,7 @@ class MainApplication:
 
         # Standard mode validations
         # Check if STTLs are provided (either downloaded or custom)
-        custom_sttl_input = self.app.custom_sttl_entry.get().strip()
+        custom_sttl_input = self._custom_sttl_text()
         has_sttls = (hasattr(self, 'sttls') and self.sttls) or custom_sttl_input
 
         if not has_sttls:
@@ -603,7 +693,7 @@ class MainApplication:
 
     def kill_with_confirmation(self):
         """Confirm before killing process"""
-        if not self.current_thread or not self.current_thread.is_alive():
+        if not self.is_operation_running():
             messagebox.showinfo("No Active Operation",
                               "There is no operation currently running.")
             return
@@ -693,21 +783,24 @@ Navigation:
 
     def _add_placeholder(self, entry, placeholder_text):
         """Add placeholder text to an entry widget"""
+        entry.placeholder_text = placeholder_text  # read back by the shared focus handlers
         entry.insert(0, placeholder_text)
         entry.config(fg='#999999')
 
-        def on_focus_in(event):
-            if entry.get() == placeholder_text:
-                entry.delete(0, tk.END)
-                entry.config(fg='#212529')
+        entry.bind('<FocusIn>', self._on_placeholder_focus_in)
+        entry.bind('<FocusOut>', self._on_placeholder_focus_out)
 
-        def on_focus_out(event):
-            if not entry.get():
-                entry.insert(0, placeholder_text)
-                entry.config(fg='#999999')
+    def _on_placeholder_focus_in(self, event):
+        entry = event.widget
+        if entry.get() == entry.placeholder_text:
+            entry.delete(0, tk.END)
+            entry.config(fg='#212529')
 
-        entry.bind('<FocusIn>', on_focus_in)
-        entry.bind('<FocusOut>', on_focus_out)
+    def _on_placeholder_focus_out(self, event):
+        entry = event.widget
+        if not entry.get():
+            entry.insert(0, entry.placeholder_text)
+            entry.config(fg='#999999')
 
     # ===== SESSION PERSISTENCE =====
 
@@ -741,24 +834,23 @@ Navigation:
                 'window_position': f"+{self.app.winfo_x()}+{self.app.winfo_y()}"
             }
 
-            session_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                                       'session_state.json')
-            with open(session_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            # Encode first, then write it in one go to a temp file that replaces the old state
+            payload = json_dumps(state, indent=True)
+            tmp_file = SESSION_FILE + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, SESSION_FILE)
         except Exception as e:
             self.logger.log(f"Could not save session state: {e}", level='error')
 
     def restore_session_state(self):
         """Restore previous session state"""
         try:
-            session_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                                       'session_state.json')
-
-            if not os.path.exists(session_file):
+            if not os.path.exists(SESSION_FILE):
                 return
 
-            with open(session_file, 'r') as f:
-                state = json.load(f)
+            with open(SESSION_FILE, 'rb') as f:
+                state = json_loads(f.read())
 
             # Restore URLs (clear placeholder first)
             if state.get('polarion_url'):
@@ -786,7 +878,7 @@ Navigation:
             if geometry and '+' in geometry:
                 try:
                     self.app.geometry(geometry)
-                except:
+                except tk.TclError:
                     pass  # Invalid geometry, skip
 
             self.logger.log("✅ Session restored from previous run", level='success')
@@ -808,6 +900,8 @@ Navigation:
 
     def export_logs(self):
         """Export logs to a text file"""
+        from tkinter import filedialog  # Only needed once a file dialog is opened
+
         file_path = filedialog.asksaveasfilename(
             title="Export Logs",
             defaultextension=".txt",
@@ -817,9 +911,12 @@ Navigation:
 
         if file_path:
             try:
-                log_content = self.app.log_text.get(1.0, tk.END)
+                log_text = self.app.log_text
+                last_line = int(log_text.index('end-1c').partition('.')[0])
+                # Copy the log out a chunk of lines at a time rather than as one huge string
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(log_content)
+                    for line in range(1, last_line + 1, EXPORT_CHUNK_LINES):
+                        f.write(log_text.get(f'{line}.0', f'{line + EXPORT_CHUNK_LINES}.0'))
                 self.logger.log(f"✅ Logs exported to: {file_path}", level='success')
                 self.app.show_toast(f"Logs exported successfully!", 'success')
             except Exception as e:
@@ -828,33 +925,50 @@ Navigation:
     def filter_logs(self):
         """Filter logs by level"""
         level = self.app.log_level_var.get()
-        # This would require storing log entries with their levels
-        # For now, just log the action
-        if level != 'all':
-            self.logger.log(f"🔍 Filtering logs: showing {level} only", level='info')
+        # Every log line carries its level as a tag, so hiding the other levels is one elide per tag
+        for tag in LOG_LEVEL_TAGS:
+            self.app.log_text.tag_config(tag, elide=level not in ('all', tag))
+
+    def _schedule_log_search(self, event=None):
+        """Run search_logs once typing in the search box pauses for LOG_SEARCH_DEBOUNCE_MS"""
+        if self._log_search_after_id is not None:
+            self.app.after_cancel(self._log_search_after_id)
+        self._log_search_after_id = self.app.after(LOG_SEARCH_DEBOUNCE_MS, self._on_log_search_paused)
+
+    def _on_log_search_paused(self):
+        self._log_search_after_id = None
+        self.search_logs()
 
     def search_logs(self):
-        """Search logs for text"""
-        search_term = self.app.log_search_entry.get()
-        if not search_term:
+        """Search logs for text, highlighting the matches in the visible part of the log"""
+        self._log_search_term = self.app.log_search_entry.get()
+        if self._log_search_term:
+            self._highlight_visible_matches()
+        else:
             # Clear any existing highlights
             self.app.log_text.tag_remove('search_highlight', '1.0', tk.END)
-            return
-
-        # Remove previous highlights
-        self.app.log_text.tag_remove('search_highlight', '1.0', tk.END)
 
-        # Configure highlight tag
-        self.app.log_text.tag_config('search_highlight', background='yellow', foreground='black')
+    def _on_log_view_changed(self, first, last):
+        """yscrollcommand of the log: keep the scrollbar in sync and re-highlight the new view"""
+        self.app.log_text.vbar.set(first, last)
+        if self._log_search_term and not self._log_highlight_pending:
+            self._log_highlight_pending = True
+            self.app.after_idle(self._highlight_visible_matches)
+
+    def _highlight_visible_matches(self):
+        self._log_highlight_pending = False
+        search_term = self._log_search_term
+        log_text = self.app.log_text
+        log_text.tag_remove('search_highlight', '1.0', tk.END)
+        if not search_term:
+            return
 
-        # Search and highlight
-        start_pos = '1.0'
-        while True:
-            start_pos = self.app.log_text.search(search_term, start_pos, stopindex=tk.END, nocase=True)
-            if not start_pos:
-                break
+        # Only the lines on screen are searched, however large the log has grown
+        start_pos = log_text.index('@0,0 linestart')
+        stop_pos = log_text.index(f'@0,{log_text.winfo_height()} lineend')
+        while start_pos := log_text.search(search_term, start_pos, stopindex=stop_pos, nocase=True):
             end_pos = f"{start_pos}+{len(search_term)}c"
-            self.app.log_text.tag_add('search_highlight', start_pos, end_pos)
+            log_text.tag_add('search_highlight', start_pos, end_pos)
             start_pos = end_pos
 
     # ===== SCHEDULER METHODS =====
@@ -932,20 +1046,29 @@ Navigation:
 
     def delete_scheduled_task(self, task_id):
         """Delete a scheduled task with confirmation"""
-        task = self.task_scheduler.get_task(task_id)
-        if not task:
+        self.delete_scheduled_tasks([task_id])
+
+    def delete_scheduled_tasks(self, task_ids):
+        """Delete several scheduled tasks behind a single confirmation"""
+        tasks = [task for task_id in task_ids if (task := self.task_scheduler.get_task(task_id))]
+        if not tasks:
             return
 
+        if len(tasks) == 1:
+            message = f"Are you sure you want to delete the task:\n\n'{tasks[0].name}'\n\n"
+        else:
+            names = "\n".join(f"'{task.name}'" for task in tasks)
+            message = f"Are you sure you want to delete these {len(tasks)} tasks:\n\n{names}\n\n"
         result = messagebox.askyesno(
             "Delete Task",
-            f"Are you sure you want to delete the task:\n\n'{task.name}'\n\n"
-            "This cannot be undone.",
+            message + "This cannot be undone.",
             icon='warning'
         )
 
         if result:
-            if self.task_scheduler.remove_task(task_id):
-                self.app.show_toast(f"🗑️ Task deleted", 'info')
+            removed = sum(self.task_scheduler.remove_task(task.task_id) for task in tasks)
+            if removed:
+                self.app.show_toast("🗑️ Task deleted" if removed == 1 else f"🗑️ {removed} tasks deleted", 'info')
                 self.refresh_scheduled_tasks_display()
 
     def toggle_scheduled_task(self, task_id):
@@ -966,24 +1089,10 @@ Navigation:
     def refresh_scheduled_tasks_display(self):
         """Refresh the scheduled tasks display in GUI"""
         tasks = self.task_scheduler.get_all_tasks()
-        self.app.update_scheduled_tasks_list(tasks)
-
-        # Set up callbacks for task action buttons
-        for widget in self.app.tasks_frame.winfo_children():
-            if hasattr(widget, 'task_id'):
-                for child in widget.winfo_children():
-                    if isinstance(child, tk.Frame):
-                        for button in child.winfo_children():
-                            if isinstance(button, tk.Button) and hasattr(button, 'task_id'):
-                                button_text = button.cget('text')
-                                task_id = button.task_id
-
-                                if 'Enable' in button_text or 'Disable' in button_text:
-                                    button.config(command=lambda tid=task_id: self.toggle_scheduled_task(tid))
-                                elif 'Edit' in button_text:
-                                    button.config(command=lambda tid=task_id: self.edit_scheduled_task(tid))
-                                elif 'Delete' in button_text:
-                                    button.config(command=lambda tid=task_id: self.delete_scheduled_task(tid))
+        self.app.update_scheduled_tasks_list(tasks,
+                                             on_toggle=self.toggle_scheduled_task,
+                                             on_edit=self.edit_scheduled_task,
+                                             on_delete=self.delete_scheduled_task)
 
     def execute_scheduled_task(self, task: ScheduledTask) -> bool:
         """
@@ -996,36 +1105,30 @@ Navigation:
             True if successful, False otherwise
         """
         try:
-            self.logger.log(f"🚀 Executing scheduled task: {task.name}", level='info')
-            self.logger.log(f"   Type: {task.task_type}", level='info')
-            self.logger.log(f"   Schedule: {task.schedule_type} - {task.schedule_value}", level='info')
-
-            config = task.config
-            build_url = config.get('build_url', '')
-            device_serial = config.get('device', 'any')
+            self.logger.log_many([
+                f"🚀 Executing scheduled task: {task.name}",
+                f"   Type: {task.task_type}",
+                f"   Schedule: {task.schedule_type} - {task.schedule_value}",
+            ], level='info')
 
             # Execute based on task type
-            if task.task_type == 'flash':
-                return self._execute_flash_task(build_url, device_serial)
-
-            elif task.task_type == 'test':
-                test_url = config.get('test_url', '')
-                return self._execute_test_task(test_url)
-
-            elif task.task_type == 'flash_and_test':
-                # Flash first, then test
-                flash_success = self._execute_flash_task(build_url, device_serial)
-                if flash_success:
-                    test_url = config.get('test_url', '')
-                    return self._execute_test_task(test_url)
-                return False
-
-            return False
+            handler = self._task_handlers.get(task.task_type)
+            return handler(task.config) if handler else False
 
         except Exception as e:
             self.logger.log(f"❌ Scheduled task execution error: {e}", level='error')
             return False
 
+    def _run_flash_config(self, config) -> bool:
+        return self._execute_flash_task(config.get('build_url', ''), config.get('device', 'any'))
+
+    def _run_test_config(self, config) -> bool:
+        return self._execute_test_task(config.get('test_url', ''))
+
+    def _run_flash_and_test_config(self, config) -> bool:
+        # Flash first, then test
+        return self._run_flash_config(config) and self._run_test_config(config)
+
     def _execute_flash_task(self, build_url: str, device_serial: str) -> bool:
         """Execute a flash task"""
         try:
@@ -1071,7 +1174,7 @@ Navigation:
             devices = {}  # Would need to get from monitoring daemon
 
             # Run tests
-            polarion_run_name = test_url.split('/')[-1]
+            polarion_run_name = polarion_run_name_from_url(test_url)
             result = self.zybot_executor.run_tests(polarion_run_name, devices, sttls)
 
             if result == "Pass":
@@ -1091,6 +1194,10 @@ Navigation:
         self.app.mainloop()
         self.monitor_daemon.stop()
         self.task_scheduler.stop()
+        self.stop_event.set()  # Ask a still running operation to wind down
+        self._executor.shutdown(wait=False)
+        self.email_notifier.close()
+        self.logger.close()
 
     def on_closing(self):
         """Handle window close event"""
@@ -0,0 +1,42 @@
+"""
+JSON helpers that use orjson when it is installed and fall back to the stdlib
+"""
+import json
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from str or bytes
+
+    Raises:
+        ValueError: If the data is not valid JSON (orjson.JSONDecodeError subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, default=None, indent=False):
+    """Serialize obj to JSON bytes, compact unless ``indent`` asks for 2-space indentation
+
+    datetime objects are written as ISO 8601 strings. ``default`` is called for
+    any other object that is not natively serializable, like json.dumps(default=...).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if indent else None)
+
+    def fallback(o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if default is not None:
+            return default(o)
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+    if indent:
+        return json.dumps(obj, default=fallback, indent=2).encode()
+    return json.dumps(obj, default=fallback, separators=(',', ':')).encode()
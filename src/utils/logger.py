@@ -1,7 +1,17 @@
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import datetime
+import queue
+import time
 import tkinter as tk
 
+# The GUI log keeps at most this many lines (the log file keeps everything)
+MAX_WIDGET_LINES = 5000
+# Lines dropped from the top at once when the cap is hit, so trimming happens rarely
+TRIM_WIDGET_LINES = 1000
+# How often queued lines are flushed into the GUI log (ms); log() may be called from any thread
+FLUSH_INTERVAL_MS = 100
+
 class Logger:
     def __init__(self, log_text_widget, auto_scroll_var=None, web_server=None):
         self.log_text_widget = log_text_widget
@@ -9,6 +19,8 @@ class Logger:
         self.web_server = web_server
         self.timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
         self.log_file = f"zap_log_{self.timestamp}.txt"
+        self._pending = queue.Queue()  # (text, level) waiting for the next widget flush
+        self._clock = (None, '')  # (epoch second, "HH:MM:SS") last formatted, swapped as one tuple
 
         # Configure tags for colors
         self.log_text_widget.tag_config('info', foreground='black')
@@ -16,14 +28,62 @@ class Logger:
         self.log_text_widget.tag_config('error', foreground='red')
         self.log_text_widget.tag_config('warning', foreground='#ff8800')
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler()
-            ]
-        )
+        # log() only enqueues the record; a listener thread does the file and console writes
+        log_queue = queue.Queue()
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(self.log_file), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        self._listener = QueueListener(log_queue, *handlers)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))  # the listener adds the prefix
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+        self._listener.start()
+
+        self.log_text_widget.after(FLUSH_INTERVAL_MS, self._flush_pending)
+
+    def _flush_pending(self):
+        """Move the lines queued since the last flush into the log widget (runs on the Tk thread)"""
+        chunks = []
+        while True:
+            try:
+                text, level = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            chunks.extend((text, (level,)))
+
+        try:
+            if chunks:
+                self._append_to_widget(chunks)
+            self.log_text_widget.after(FLUSH_INTERVAL_MS, self._flush_pending)
+        except tk.TclError:
+            pass  # Widget destroyed, the window is closing
+
+    def _append_to_widget(self, chunks):
+        """Insert text/tag pairs into the log widget in one call, trimming the oldest lines past the cap"""
+        widget = self.log_text_widget
+        widget.configure(state='normal')
+        widget.insert(tk.END, *chunks)
+        if int(widget.index('end-1c').split('.')[0]) > MAX_WIDGET_LINES:
+            widget.delete('1.0', f'{TRIM_WIDGET_LINES + 1}.0')
+        widget.configure(state='disabled')
+
+        # Auto-scroll if enabled
+        if self.auto_scroll_var is None or self.auto_scroll_var.get():
+            widget.see(tk.END)
+
+    def _timestamp(self):
+        """Current time as HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        second, text = self._clock
+        if second != now:
+            text = time.strftime('%H:%M:%S', time.localtime(now))
+            self._clock = (now, text)
+        return text
+
+    def close(self):
+        """Write out the records still queued for the log file and stop the listener thread"""
+        self._listener.stop()
 
     def set_web_server(self, web_server):
         """Set the web server instance for pushing logs to dashboard"""
@@ -38,19 +98,32 @@ class Logger:
         else:
             logging.info(message)
         
-        self.log_text_widget.configure(state='normal')
-        timestamp = datetime.datetime.now().strftime('%H:%M:%S')
-        self.log_text_widget.insert(tk.END, f"[{timestamp}] {message}\n", (level,))
-        self.log_text_widget.configure(state='disabled')
-
-        # Auto-scroll if enabled
-        if self.auto_scroll_var is None or self.auto_scroll_var.get():
-            self.log_text_widget.see(tk.END)
+        timestamp = self._timestamp()
+        self._pending.put((f"[{timestamp}] {message}\n", level))
 
         # Push log to web server
         if self.web_server:
             try:
                 self.web_server.add_log(message, level=level, source='ZAP')
-            except:
+            except Exception:
+                pass  # Don't let web server errors break logging
+
+    def log_many(self, messages, level='info'):
+        """Logs several messages as one GUI insert, e.g. a chunk of streamed tool output."""
+        if not messages:
+            return
+
+        log_to_file = logging.error if level == 'error' else logging.warning if level == 'warning' else logging.info
+        for message in messages:
+            log_to_file(message)
+
+        timestamp = self._timestamp()
+        self._pending.put((''.join(f"[{timestamp}] {message}\n" for message in messages), level))
+
+        # Push logs to web server
+        if self.web_server:
+            try:
+                self.web_server.add_logs(messages, level=level, source='ZAP')
+            except Exception:
                 pass  # Don't let web server errors break logging
 
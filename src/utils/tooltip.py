@@ -7,6 +7,11 @@ import tkinter as tk
 class ToolTip:
     """Create a tooltip for a given widget"""
 
+    # One hidden tooltip window per Tk root, shared by every ToolTip: (toplevel, label)
+    _windows = {}
+    # ToolTip currently showing in its root's window
+    _owners = {}
+
     def __init__(self, widget, text, delay=500):
         """
         Initialize tooltip
@@ -26,24 +31,53 @@ class ToolTip:
         self.widget.bind('<Enter>', self.schedule_show, add='+')
         self.widget.bind('<Leave>', self.hide, add='+')
         self.widget.bind('<Button>', self.hide, add='+')
-        self.widget.bind('<Motion>', self.on_motion, add='+')
-
-    def on_motion(self, event=None):
-        """Handle mouse motion - update tooltip position"""
-        # If tooltip is showing, update its position
-        if self.tooltip:
-            try:
-                x = self.widget.winfo_rootx() + 25
-                y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-                self.tooltip.wm_geometry(f"+{x}+{y}")
-            except:
-                pass  # Widget might be destroyed
 
     def schedule_show(self, event=None):
         """Schedule tooltip to show after delay"""
         self.hide()  # Hide any existing tooltip first
         self.scheduled_id = self.widget.after(self.delay, self.show)
 
+    @classmethod
+    def _get_window(cls, root):
+        """Return the shared (toplevel, label) for root, creating it hidden on first use"""
+        window = cls._windows.get(root)
+        if window and window[0].winfo_exists():
+            return window
+
+        tooltip = tk.Toplevel(root)
+        tooltip.withdraw()
+        tooltip.wm_overrideredirect(True)
+        tooltip.wm_attributes('-topmost', True)  # Always on top
+
+        # Try to make it transparent on Windows (optional)
+        try:
+            tooltip.attributes('-alpha', 0.95)
+        except tk.TclError:
+            pass
+
+        # Create tooltip content
+        frame = tk.Frame(
+            tooltip,
+            background="#ffffe0",
+            relief='solid',
+            borderwidth=1
+        )
+        frame.pack()
+
+        label = tk.Label(
+            frame,
+            background="#ffffe0",
+            foreground="#000000",
+            font=('Segoe UI', 9),
+            padx=10,
+            pady=5,
+            justify='left'
+        )
+        label.pack()
+
+        window = cls._windows[root] = (tooltip, label)
+        return window
+
     def show(self, event=None):
         """Display the tooltip"""
         if self.tooltip:
@@ -58,44 +92,25 @@ class ToolTip:
             x = self.widget.winfo_rootx() + 25
             y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
 
-            # Create tooltip window
-            self.tooltip = tk.Toplevel(self.widget)
-            self.tooltip.wm_overrideredirect(True)
-            self.tooltip.wm_attributes('-topmost', True)  # Always on top
-
-            # Try to make it transparent on Windows (optional)
-            try:
-                self.tooltip.attributes('-alpha', 0.95)
-            except:
-                pass
-
-            self.tooltip.wm_geometry(f"+{x}+{y}")
-
-            # Create tooltip content
-            frame = tk.Frame(
-                self.tooltip,
-                background="#ffffe0",
-                relief='solid',
-                borderwidth=1
-            )
-            frame.pack()
-
-            label = tk.Label(
-                frame,
-                text=self.text,
-                background="#ffffe0",
-                foreground="#000000",
-                font=('Segoe UI', 9),
-                padx=10,
-                pady=5,
-                justify='left'
-            )
-            label.pack()
+            # Reuse the shared tooltip window: retext, move and map it
+            root = self.widget._root()
+            tooltip, label = self._get_window(root)
+            label.config(text=self.text)
+            tooltip.wm_geometry(f"+{x}+{y}")
+            tooltip.deiconify()
+            tooltip.lift()
+
+            previous = ToolTip._owners.get(root)
+            if previous is not None and previous is not self:
+                previous.tooltip = None
+                previous.id = None
+            ToolTip._owners[root] = self
+            self.tooltip = tooltip
 
             # Store the ID
             self.id = id(self.tooltip)
 
-        except Exception as e:
+        except tk.TclError as e:
             print(f"Error creating tooltip: {e}")
             self.tooltip = None
 
@@ -105,15 +120,15 @@ class ToolTip:
         if self.scheduled_id:
             try:
                 self.widget.after_cancel(self.scheduled_id)
-            except:
+            except tk.TclError:
                 pass
             self.scheduled_id = None
 
-        # Destroy tooltip window
+        # Hide the shared tooltip window, keeping it for the next hover
         if self.tooltip:
             try:
-                self.tooltip.destroy()
-            except:
+                self.tooltip.withdraw()
+            except tk.TclError:
                 pass
             self.tooltip = None
             self.id = None
@@ -0,0 +1,40 @@
+import configparser
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from core.artifactory import ArtifactoryManager
+
+
+def make_manager():
+    config = configparser.ConfigParser()
+    config['JFrog'] = {'username': 'user', 'password': 'secret'}
+    return ArtifactoryManager(config, mock.Mock())
+
+
+class FindBuildFileViaAqlTest(unittest.TestCase):
+    def test_escaped_path_is_queried_unescaped_and_quoted_once(self):
+        manager = make_manager()
+        response = mock.Mock()
+        response.json.return_value = {'results': [
+            {'repo': 'builds-local', 'path': 'release 1.0/user', 'name': 'FULL_UPDATE.zip'},
+        ]}
+        manager.session = mock.Mock()
+        manager.session.post.return_value = response
+
+        url = manager._find_build_file_via_aql(
+            'https://jfrog.example.com/artifactory/builds-local/release%201.0/')
+
+        query = manager.session.post.call_args.kwargs['data']
+        criteria = json.loads(query[len('items.find('):query.index(').include(')])
+        self.assertEqual(criteria['repo'], 'builds-local')
+        self.assertEqual(criteria['$or'][0], {'path': 'release 1.0'})
+        self.assertEqual(url, 'https://jfrog.example.com/artifactory/builds-local/release%201.0/user/FULL_UPDATE.zip')
+
+
+if __name__ == '__main__':
+    unittest.main()